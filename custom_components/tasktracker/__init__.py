@@ -30,6 +30,7 @@ from .const import DOMAIN, TASKTRACKER_EVENTS
 from .coordinators import DailyPlanCoordinator
 from .intents import async_register_intents
 from .services import async_setup_services, async_unload_services
+from .utils import build_user_index
 from .www import JSModuleRegistration
 
 if TYPE_CHECKING:
@@ -165,6 +166,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "config": entry.data,
             "cache": cache,
             "coordinators": coordinators,
+            # Rebuilt on every setup; option changes always reload the entry
+            "user_index": build_user_index(user_mappings),
         }
 
         # Set up services
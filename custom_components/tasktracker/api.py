@@ -50,13 +50,15 @@ class TaskTrackerAPI:
         self.session = session
         self.host = host.rstrip("/")
         self.api_key = api_key
+        # Headers never change for a client; aiohttp copies them per request
+        self._headers = {
+            "X-API-Key": api_key,
+            "Content-Type": "application/json",
+        }
 
     def _get_headers(self) -> dict[str, str]:
         """Get request headers with API key."""
-        return {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json",
-        }
+        return self._headers
 
     async def _request(
         self,
@@ -3,22 +3,116 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
+import random
 import time
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Mapping
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Keys come from a few namespaces x configured users, so the same ones are
+# split again on every store and removal
+@lru_cache(maxsize=2048)
+def _split_key(key: str) -> tuple[str, tuple[str, ...]]:
+    namespace, *segments = key.split(":")
+    return namespace, tuple(segments)
+
+
 class TaskTrackerCache:
     """Simple TTL-based cache for API responses."""
 
-    def __init__(self) -> None:
-        """Initialize the cache."""
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        ttl_jitter: float = 0.15,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            clock: Source of entry timestamps, in seconds. Monotonic so that
+                wall-clock adjustments cannot expire or revive entries.
+            ttl_jitter: Fraction of a write-time TTL by which an entry may
+                expire early, so entries cached together do not all expire
+                (and get refetched) at the same moment.
+
+        """
+        self._clock = clock
+        self._ttl_jitter = ttl_jitter
         self._data: dict[str, Any] = {}
         self._timestamps: dict[str, float] = {}
+        # Keys are "namespace:segment:...". Index them by namespace and by
+        # trailing segment so the common invalidation patterns only visit
+        # the affected keys instead of scanning the whole cache.
+        self._namespaces: dict[str, set[str]] = {}
+        self._segments: dict[str, set[str]] = {}
+        # Expiry times of entries stored with a TTL, plus a min-heap of them
+        # so writes can drop expired entries that are never read again
+        self._expiries: dict[str, float] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+        # Fetches in progress, so concurrent misses share one API call
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
         self._lock = asyncio.Lock()
 
+    def _index(self, key: str) -> None:
+        namespace, segments = _split_key(key)
+        self._namespaces.setdefault(namespace, set()).add(key)
+        for segment in segments:
+            self._segments.setdefault(segment, set()).add(key)
+
+    def _remove(self, key: str) -> None:
+        del self._data[key]
+        del self._timestamps[key]
+        self._expiries.pop(key, None)
+        namespace, segments = _split_key(key)
+        self._unindex(self._namespaces, namespace, key)
+        for segment in segments:
+            self._unindex(self._segments, segment, key)
+
+    def _prune(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            # Skip heap records superseded by a later set() or removal
+            if self._expiries.get(key) == expiry:
+                _LOGGER.debug("Pruned expired cache entry: %s", key)
+                self._remove(key)
+
+    @staticmethod
+    def _unindex(index: dict[str, set[str]], name: str, key: str) -> None:
+        keys = index.get(name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[name]
+
+    def _matching_keys(self, pattern: str) -> list[str]:
+        namespace, _, rest = pattern.partition(":")
+        if not rest:
+            # "namespace:" or a bare "namespace"
+            return list(self._namespaces.get(namespace, ()))
+        if not namespace and ":" not in rest:
+            # ":segment", e.g. every key for one username
+            return list(self._segments.get(rest, ()))
+        return [k for k in self._data if pattern in k]
+
+    @staticmethod
+    def _key_matches(key: str, pattern: str) -> bool:
+        # Single-key form of _matching_keys, for keys not in the indexes
+        namespace, _, rest = pattern.partition(":")
+        key_namespace, segments = _split_key(key)
+        if not rest:
+            return key_namespace == namespace
+        if not namespace and ":" not in rest:
+            return rest in segments
+        return pattern in key
+
     async def get(self, key: str, ttl: int) -> Any | None:
         """
         Get a value from cache if not expired.
@@ -31,31 +125,161 @@ class TaskTrackerCache:
             Cached value if found and not expired, None otherwise
 
         """
-        async with self._lock:
-            if key in self._data:
-                age = time.time() - self._timestamps[key]
-                if age < ttl:
-                    _LOGGER.debug("Cache hit: %s (age: %.1fs)", key, age)
-                    return self._data[key]
-                _LOGGER.debug("Cache expired: %s (age: %.1fs)", key, age)
-                # Clean up expired entry
-                del self._data[key]
-                del self._timestamps[key]
+        return self.get_sync(key, ttl)
+
+    def get_sync(self, key: str, ttl: int) -> Any | None:
+        """
+        Get a value from cache if not expired, without a coroutine.
+
+        Reads need no lock: this never awaits, and writers never await while
+        holding the lock, so a read can't observe a half-applied write.
+
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+
+        """
+        timestamp = self._timestamps.get(key)
+        if timestamp is None:
             return None
+        now = self._clock()
+        age = now - timestamp
+        expiry = self._expiries.get(key)
+        if age < ttl and (expiry is None or now < expiry):
+            _LOGGER.debug("Cache hit: %s (age: %.1fs)", key, age)
+            return self._data[key]
+        _LOGGER.debug("Cache expired: %s (age: %.1fs)", key, age)
+        # Clean up expired entry
+        self._remove(key)
+        return None
 
-    async def set(self, key: str, value: Any) -> None:
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
         """
         Store a value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
+            ttl: Time to live in seconds, if known when storing. Entries with
+                a TTL expire up to ``ttl_jitter`` of it early, and are dropped
+                by later writes once expired even if never read again.
 
         """
         async with self._lock:
-            self._data[key] = value
-            self._timestamps[key] = time.time()
-            _LOGGER.debug("Cached: %s", key)
+            now = self._clock()
+            self._prune(now)
+            self._store(key, value, now, ttl)
+
+    async def set_many(
+        self, items: Mapping[str, Any], ttl: float | None = None
+    ) -> None:
+        """
+        Store several values in cache under a single lock acquisition.
+
+        Args:
+            items: Values to cache, by key
+            ttl: Time to live in seconds, as for ``set``
+
+        """
+        async with self._lock:
+            now = self._clock()
+            self._prune(now)
+            for key, value in items.items():
+                self._store(key, value, now, ttl)
+
+    def _store(self, key: str, value: Any, now: float, ttl: float | None) -> None:
+        if key not in self._data:
+            self._index(key)
+        self._data[key] = value
+        self._timestamps[key] = now
+        if ttl is None:
+            self._expiries.pop(key, None)
+        else:
+            jitter = random.uniform(1 - self._ttl_jitter, 1)  # noqa: S311
+            expiry = now + ttl * jitter
+            self._expiries[key] = expiry
+            heapq.heappush(self._expiry_heap, (expiry, key))
+        _LOGGER.debug("Cached: %s", key)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        ttl: int,
+        fetch_fn: Callable[[], Awaitable[Any]],
+        *,
+        force_refresh: bool = False,
+        should_cache: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """
+        Get a value from cache, fetching and storing it on a miss.
+
+        Concurrent callers for the same key share a single fetch; if it
+        fails, they all see the error and nothing is cached. The fetch runs
+        in its own task, so cancelling any one caller (including the one
+        that started it) leaves the others waiting on it unaffected. Callers
+        arriving after the key is invalidated start a new fetch, and the
+        older one's result is not cached.
+
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds
+            fetch_fn: Async function producing a fresh value
+            force_refresh: If True, skip the cached value and any fetch
+                already in flight, and fetch
+            should_cache: Whether a fetched value should be stored
+
+        Returns:
+            Cached or freshly fetched value
+
+        """
+        if not force_refresh:
+            cached = self.get_sync(key, ttl)
+            if cached is not None:
+                return cached
+
+        task = None if force_refresh else self._inflight.get(key)
+        if task is not None:
+            _LOGGER.debug("Joining in-flight fetch for: %s", key)
+        else:
+            _LOGGER.debug("Cache miss for: %s, fetching fresh data", key)
+            task = asyncio.get_running_loop().create_task(
+                self._fetch_and_store(key, ttl, fetch_fn, should_cache)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._fetch_done(key, t))
+        # Shield so a cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        ttl: int,
+        fetch_fn: Callable[[], Awaitable[Any]],
+        should_cache: Callable[[Any], bool],
+    ) -> Any:
+        result = await fetch_fn()
+        if should_cache(result):
+            async with self._lock:
+                # An invalidation or forced refresh since this fetch started
+                # drops it from _inflight; its result may predate that change
+                if self._inflight.get(key) is asyncio.current_task():
+                    now = self._clock()
+                    self._prune(now)
+                    self._store(key, result, now, ttl)
+                else:
+                    _LOGGER.debug("Not caching superseded fetch for: %s", key)
+        return result
+
+    def _fetch_done(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark errors retrieved so a fetch whose callers all went away is
+        # not logged as never retrieved
+        if not task.cancelled():
+            task.exception()
 
     async def invalidate(self, pattern: str | None = None) -> None:
         """
@@ -63,6 +287,10 @@ class TaskTrackerCache:
 
         Args:
             pattern: Pattern to match cache keys. If None, clears all cache.
+                ``"namespace:"`` (or a bare ``"namespace"``) matches keys in
+                that namespace and ``":segment"`` matches keys with that
+                segment after the namespace, e.g. ``":<username>"``. Any other
+                pattern matches keys containing it.
 
         """
         async with self._lock:
@@ -70,17 +298,42 @@ class TaskTrackerCache:
                 count = len(self._data)
                 self._data.clear()
                 self._timestamps.clear()
+                self._namespaces.clear()
+                self._segments.clear()
+                self._expiries.clear()
+                self._expiry_heap.clear()
+                # Fetches already under way must not repopulate the cache
+                self._inflight.clear()
                 _LOGGER.debug("Cleared all cache entries (%d items)", count)
             else:
-                keys_to_remove = [k for k in self._data if pattern in k]
-                for key in keys_to_remove:
-                    del self._data[key]
-                    del self._timestamps[key]
-                _LOGGER.debug(
-                    "Invalidated %d cache entries matching pattern: %s",
-                    len(keys_to_remove),
-                    pattern,
-                )
+                self._invalidate_pattern(pattern)
+
+    async def invalidate_many(self, patterns: Iterable[str]) -> None:
+        """
+        Invalidate cache entries matching any of several patterns.
+
+        Args:
+            patterns: Patterns as accepted by ``invalidate``; applied under a
+                single lock acquisition.
+
+        """
+        async with self._lock:
+            for pattern in patterns:
+                self._invalidate_pattern(pattern)
+
+    def _invalidate_pattern(self, pattern: str) -> None:
+        keys_to_remove = self._matching_keys(pattern)
+        for key in keys_to_remove:
+            self._remove(key)
+        # Later callers must start a fresh fetch rather than join one begun
+        # before the invalidation, which must not repopulate the cache either
+        for key in [k for k in self._inflight if self._key_matches(k, pattern)]:
+            del self._inflight[key]
+        _LOGGER.debug(
+            "Invalidated %d cache entries matching pattern: %s",
+            len(keys_to_remove),
+            pattern,
+        )
 
     async def get_stats(self) -> dict[str, Any]:
         """
@@ -91,7 +344,7 @@ class TaskTrackerCache:
 
         """
         async with self._lock:
-            now = time.time()
+            now = self._clock()
             ages = [now - ts for ts in self._timestamps.values()]
             return {
                 "total_entries": len(self._data),
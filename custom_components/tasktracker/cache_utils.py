@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -10,10 +11,15 @@ if TYPE_CHECKING:
 
     from homeassistant.core import HomeAssistant
 
+    from .coordinators import DailyPlanCoordinator
+
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Cap on coordinator refreshes hitting the API at once
+_MAX_CONCURRENT_REFRESHES = 5
+
 
 def get_entry_data(hass: HomeAssistant) -> dict[str, Any]:
     """
@@ -51,10 +57,9 @@ async def invalidate_user_cache(hass: HomeAssistant, username: str) -> None:
         _LOGGER.debug("Invalidated user-specific cache for: %s", username)
 
         # Also invalidate shared/global caches that might include this user's data
-        await cache.invalidate(pattern="available_tasks:")
-        await cache.invalidate(pattern="all_tasks:")
-        await cache.invalidate(pattern="recent_completions:")
-        await cache.invalidate(pattern="leftovers:")
+        await cache.invalidate_many(
+            ["available_tasks:", "all_tasks:", "recent_completions:", "leftovers:"]
+        )
         _LOGGER.debug("Invalidated shared cache entries for user mutation")
 
     # Clear coordinator data and refresh (daily plan)
@@ -74,7 +79,9 @@ async def invalidate_user_cache(hass: HomeAssistant, username: str) -> None:
                 )
 
 
-async def invalidate_all_user_caches(hass: HomeAssistant) -> None:
+async def invalidate_all_user_caches(
+    hass: HomeAssistant, *, background_refresh: bool = False
+) -> None:
     """
     Aggressively invalidate caches for ALL configured users.
 
@@ -88,6 +95,9 @@ async def invalidate_all_user_caches(hass: HomeAssistant) -> None:
 
     Args:
         hass: Home Assistant instance
+        background_refresh: If True, schedule coordinator refreshes as
+            background tasks instead of waiting for them. Only for callers
+            that do not fire events relying on the refreshed data.
 
     """
     entry_data = get_entry_data(hass)
@@ -99,32 +109,38 @@ async def invalidate_all_user_caches(hass: HomeAssistant) -> None:
         return
 
     # Invalidate all task-related caches (use prefix patterns to match all variants)
-    await cache.invalidate(pattern="recommended_tasks:")
-    await cache.invalidate(pattern="available_tasks:")
-    await cache.invalidate(pattern="all_tasks:")
-    await cache.invalidate(pattern="recent_completions:")
-    await cache.invalidate(pattern="leftovers:")
-    await cache.invalidate(pattern="encouragement:")
-    await cache.invalidate(pattern="available_users")
+    await cache.invalidate_many(
+        [
+            "recommended_tasks:",
+            "available_tasks:",
+            "all_tasks:",
+            "recent_completions:",
+            "leftovers:",
+            "encouragement:",
+            "available_users",
+        ]
+    )
     _LOGGER.debug("Invalidated all shared caches")
 
-    # Invalidate per-user caches and coordinators for ALL configured users
-    for username in coordinators:
-        # Invalidate user-specific cache entries
-        await cache.invalidate(pattern=f":{username}")
+    # Invalidate user-specific cache entries for ALL configured users
+    await cache.invalidate_many(f":{username}" for username in coordinators)
 
-        # Clear and refresh coordinator
+    # Clear and refresh coordinators for ALL configured users
+    to_refresh: dict[str, DailyPlanCoordinator] = {}
+    for username in coordinators:
         daily_plan_coord = coordinators[username].get("daily_plan")
         if daily_plan_coord:
             daily_plan_coord.data = None
-            # Await refresh so fresh data is available before events fire
-            try:
-                await daily_plan_coord.async_refresh()
-            except (TimeoutError, OSError) as err:
-                _LOGGER.warning(
-                    "Failed to refresh coordinator for %s: %s", username, err
+            if background_refresh:
+                hass.async_create_background_task(
+                    daily_plan_coord.async_refresh(),
+                    name=f"tasktracker-refresh-{username}-daily_plan",
                 )
-                # Continue with other users even if one fails
+            else:
+                to_refresh[username] = daily_plan_coord
+
+    # Await refreshes so fresh data is available before events fire
+    await _async_refresh_coordinators(to_refresh)
 
     user_count = len(coordinators)
     _LOGGER.info(
@@ -132,6 +148,36 @@ async def invalidate_all_user_caches(hass: HomeAssistant) -> None:
     )
 
 
+async def _async_refresh_coordinators(
+    coordinators: dict[str, DailyPlanCoordinator],
+) -> None:
+    """
+    Refresh coordinators concurrently, logging failures per user.
+
+    Args:
+        coordinators: Coordinator to refresh for each username
+
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REFRESHES)
+
+    async def _refresh(coordinator: DailyPlanCoordinator) -> None:
+        async with semaphore:
+            await coordinator.async_refresh()
+
+    results = await asyncio.gather(
+        *(_refresh(coordinator) for coordinator in coordinators.values()),
+        return_exceptions=True,
+    )
+    for username, result in zip(coordinators, results, strict=True):
+        # Continue with other users even if one fails
+        if isinstance(result, (TimeoutError, OSError)):
+            _LOGGER.warning(
+                "Failed to refresh coordinator for %s: %s", username, result
+            )
+        elif isinstance(result, BaseException):
+            raise result
+
+
 async def get_cached_or_fetch(
     hass: HomeAssistant,
     cache_key: str,
@@ -157,19 +203,14 @@ async def get_cached_or_fetch(
     entry_data = get_entry_data(hass)
     cache = entry_data.get("cache")
 
-    # Check cache first (unless force refresh)
-    if cache and not force_refresh:
-        cached = await cache.get(cache_key, ttl=ttl)
-        if cached:
-            _LOGGER.debug("Cache hit for: %s", cache_key)
-            return cached
-
-    # Fetch fresh data
-    _LOGGER.debug("Cache miss for: %s, fetching fresh data", cache_key)
-    result = await fetch_fn()
-
-    # Store in cache if successful
-    if cache and result and result.get("success"):
-        await cache.set(cache_key, result)
-
-    return result
+    if not cache:
+        return await fetch_fn()
+
+    # Only successful responses are cached; concurrent misses share one fetch
+    return await cache.get_or_fetch(
+        cache_key,
+        ttl,
+        fetch_fn,
+        force_refresh=force_refresh,
+        should_cache=lambda result: bool(result and result.get("success")),
+    )
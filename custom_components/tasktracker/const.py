@@ -188,6 +188,7 @@ CACHE_TTL_ALL_TASKS: Final = 300  # 5 minutes
 
 # Coordinator configuration
 COORDINATOR_UPDATE_INTERVAL_DAILY_PLAN: Final = 180  # 3 minutes
+COORDINATOR_UPDATE_JITTER: Final = 0.15  # +/- fraction of the interval
 
 # Additional cache TTLs
 CACHE_TTL_AVAILABLE_USERS: Final = 600  # 10 minutes - config changes are rare
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import logging
+import random
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import COORDINATOR_UPDATE_INTERVAL_DAILY_PLAN, COORDINATOR_UPDATE_JITTER
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
@@ -49,7 +52,13 @@ class DailyPlanCoordinator(TaskTrackerCoordinator):
             api,
             username,
             "Daily Plan",
-            update_interval=timedelta(seconds=180),  # 3 minutes
+            # Jittered so coordinators created together do not poll in lockstep
+            update_interval=timedelta(
+                seconds=COORDINATOR_UPDATE_INTERVAL_DAILY_PLAN
+                * random.uniform(  # noqa: S311
+                    1 - COORDINATOR_UPDATE_JITTER, 1 + COORDINATOR_UPDATE_JITTER
+                )
+            ),
         )
         self.select_recommended = False
         self.fair_weather = None
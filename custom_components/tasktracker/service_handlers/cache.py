@@ -27,8 +27,8 @@ def invalidate_cache_handler_factory() -> Callable[
 
     The handler will:
         - Invalidate all cached data for all users
-        - Refresh all coordinators to fetch fresh data
-        - Return success status
+        - Start background refreshes of all coordinators
+        - Return success status without waiting for the refreshes
 
     This is useful when users want to force a refresh from the UI or when
     external changes need to be reflected immediately.
@@ -56,16 +56,18 @@ def invalidate_cache_handler_factory() -> Callable[
                 "Cache invalidation service called - clearing all caches and refreshing coordinators"
             )
 
-            # Invalidate all user caches and refresh coordinators
-            await invalidate_all_user_caches(hass)
+            # Nothing here waits on fresh data, so let the refreshes run in the
+            # background; get_daily_plan falls back to the API meanwhile
+            await invalidate_all_user_caches(hass, background_refresh=True)
 
             _LOGGER.info(
-                "Cache invalidation complete - all caches cleared, coordinators refreshed"
+                "Cache invalidation complete - all caches cleared, "
+                "coordinator refreshes started"
             )
 
             return {
                 "success": True,
-                "message": "All caches invalidated and coordinators refreshed",
+                "message": "All caches invalidated and coordinator refreshes started",
             }
         except Exception:
             _LOGGER.exception("Unexpected error in invalidate_cache_service")
@@ -134,9 +134,11 @@ async def async_setup_services(  # noqa: PLR0915
 
     def get_current_config() -> dict[str, Any]:
         """Get the current config from hass.data instead of using static config."""
-        # Find the first (and should be only) TaskTracker config entry
-        for entry_data in hass.data.get(DOMAIN, {}).values():
-            if "config" in entry_data:
+        # Use the first (and should be only) TaskTracker config entry
+        domain_data = hass.data.get(DOMAIN)
+        if domain_data:
+            entry_data = next(iter(domain_data.values()), None)
+            if entry_data and "config" in entry_data:
                 return entry_data["config"]
         # Fallback to the original config if no entry found
         return config
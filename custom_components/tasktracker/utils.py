@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from .const import (
@@ -17,6 +18,57 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keys of the user index stored alongside each config entry in hass.data
+USER_INDEX_HA_TO_TASKTRACKER = "ha_to_tasktracker"
+USER_INDEX_TASKTRACKER_TO_HA = "tasktracker_to_ha"
+
+# Display names for priorities 1 (highest) through 5
+_PRIORITY_NAMES = ("High", "Medium", "Low", "Very Low", "Minimal")
+
+
+def build_user_index(users: list[dict[str, Any]]) -> dict[str, dict[str, str]]:
+    """
+    Build O(1) lookup tables for the configured user mappings.
+
+    The first mapping wins for duplicate IDs, matching the linear scans
+    this index replaces.
+
+    Args:
+        users: User mappings from the integration configuration
+
+    Returns:
+        Dictionary with HA user ID -> TaskTracker username and reverse mappings
+
+    """
+    ha_to_tasktracker: dict[str, str] = {}
+    tasktracker_to_ha: dict[str, str] = {}
+    for user in users:
+        ha_user_id = user.get(CONF_HA_USER_ID)
+        tasktracker_username = user.get(CONF_TASKTRACKER_USERNAME)
+        if ha_user_id:
+            ha_to_tasktracker.setdefault(ha_user_id, tasktracker_username)
+        if tasktracker_username:
+            tasktracker_to_ha.setdefault(tasktracker_username, ha_user_id)
+
+    return {
+        USER_INDEX_HA_TO_TASKTRACKER: ha_to_tasktracker,
+        USER_INDEX_TASKTRACKER_TO_HA: tasktracker_to_ha,
+    }
+
+
+def _get_user_index(
+    hass: HomeAssistant, config: dict[str, Any]
+) -> dict[str, dict[str, str]] | None:
+    """Return the user index stored for the entry owning ``config``, if any."""
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
+        return None
+
+    for entry_data in domain_data.values():
+        if entry_data.get("config") is config:
+            return entry_data.get("user_index")
+    return None
+
 
 def get_user_context(hass: HomeAssistant, ha_user_id: str) -> str | None:
     """
@@ -34,31 +86,33 @@ def get_user_context(hass: HomeAssistant, ha_user_id: str) -> str | None:
         return None
 
     # Get all integration data
-    domain_data = hass.data.get(DOMAIN, {})
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
+        return None
 
     # Search through all config entries
     for entry_data in domain_data.values():
-        config = entry_data.get("config", {})
-        users = config.get(CONF_USERS, [])
+        user_index = entry_data.get("user_index")
+        if user_index is not None:
+            username = user_index[USER_INDEX_HA_TO_TASKTRACKER].get(ha_user_id)
+            if username is not None:
+                return username
+            continue
 
-        for user in users:
+        # No index (e.g. hand-built entry data); fall back to a linear scan
+        config = entry_data.get("config")
+        if not config:
+            continue
+
+        for user in config.get(CONF_USERS, ()):
             if user.get(CONF_HA_USER_ID) == ha_user_id:
                 return user.get(CONF_TASKTRACKER_USERNAME)
 
     return None
 
 
-def format_task_duration(minutes: int) -> str:
-    """
-    Format task duration in a human-readable way.
-
-    Args:
-        minutes: Duration in minutes
-
-    Returns:
-        Formatted duration string
-
-    """
+def _format_task_duration(minutes: int) -> str:
+    """Format task duration without the lookup table."""
     if minutes == 0:
         return "0 min"
     elif minutes == 1:  # noqa: RET505
@@ -75,17 +129,8 @@ def format_task_duration(minutes: int) -> str:
     return f"{hours} hr {remaining_minutes} min"
 
 
-def format_time_ago(minutes: int) -> str:
-    """
-    Format time ago in a human-readable way.
-
-    Args:
-        minutes: Time in minutes ago
-
-    Returns:
-        Formatted time string
-
-    """
+def _format_time_ago(minutes: int) -> str:
+    """Format time ago without the lookup table."""
     if minutes < 60:  # noqa: PLR2004
         if minutes == 1:
             return "1 minute ago"
@@ -102,6 +147,52 @@ def format_time_ago(minutes: int) -> str:
         return f"{days} days ago"
 
 
+# Precomputed strings for the first 24 hours, which covers nearly every call
+_FORMAT_TABLE_MAX_MINUTES = 1440
+_TASK_DURATION_TABLE = tuple(
+    _format_task_duration(i) for i in range(_FORMAT_TABLE_MAX_MINUTES + 1)
+)
+_TIME_AGO_TABLE = tuple(
+    _format_time_ago(i) for i in range(_FORMAT_TABLE_MAX_MINUTES + 1)
+)
+
+
+def format_task_duration(minutes: int) -> str:
+    """
+    Format task duration in a human-readable way.
+
+    Args:
+        minutes: Duration in minutes
+
+    Returns:
+        Formatted duration string
+
+    """
+    # The tables are keyed by int; other numbers (e.g. floats) keep their
+    # own formatting
+    if type(minutes) is int and 0 <= minutes <= _FORMAT_TABLE_MAX_MINUTES:
+        return _TASK_DURATION_TABLE[minutes]
+    return _format_task_duration(minutes)
+
+
+def format_time_ago(minutes: int) -> str:
+    """
+    Format time ago in a human-readable way.
+
+    Args:
+        minutes: Time in minutes ago
+
+    Returns:
+        Formatted time string
+
+    """
+    # The tables are keyed by int; other numbers (e.g. floats) keep their
+    # own formatting
+    if type(minutes) is int and 0 <= minutes <= _FORMAT_TABLE_MAX_MINUTES:
+        return _TIME_AGO_TABLE[minutes]
+    return _format_time_ago(minutes)
+
+
 def validate_api_response(response: dict[str, Any] | None) -> bool:
     """
     Validate API response structure.
@@ -113,11 +204,8 @@ def validate_api_response(response: dict[str, Any] | None) -> bool:
         True if valid, False otherwise
 
     """
-    if not response or not isinstance(response, dict):
-        return False
-
-    success = response.get("success")
-    return success is True
+    # isinstance() also rejects None, and {}.get("success") is never True
+    return isinstance(response, dict) and response.get("success") is True
 
 
 def get_tasktracker_username_for_ha_user(
@@ -142,29 +230,47 @@ def get_tasktracker_username_for_ha_user(
         return None
 
     users = config.get(CONF_USERS, [])
-    _LOGGER.debug(
-        "Looking for HA user ID '%s' in user mappings: %s",
-        ha_user_id,
-        users,
-    )
-
-    for user in users:
-        user_ha_id = user.get(CONF_HA_USER_ID)
-        user_tasktracker = user.get(CONF_TASKTRACKER_USERNAME)
-        _LOGGER.debug(
-            "Comparing HA user ID '%s' with mapping HA ID '%s' -> TaskTracker '%s'",
-            ha_user_id,
-            user_ha_id,
-            user_tasktracker,
-        )
-        if user_ha_id == ha_user_id:
-            username = user_tasktracker
+    # Checked once; this runs on every service call
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+
+    user_index = _get_user_index(hass, config)
+    if user_index is not None:
+        username = user_index[USER_INDEX_HA_TO_TASKTRACKER].get(ha_user_id)
+        if username is not None:
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Found TaskTracker username '%s' for HA user ID '%s'",
+                    username,
+                    ha_user_id,
+                )
+            return username
+    else:
+        # No index for this config (e.g. built outside of entry setup)
+        if debug_enabled:
             _LOGGER.debug(
-                "Found TaskTracker username '%s' for HA user ID '%s'",
-                username,
+                "Looking for HA user ID '%s' in user mappings: %s",
                 ha_user_id,
+                users,
             )
-            return username
+
+        for user in users:
+            user_ha_id = user.get(CONF_HA_USER_ID)
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Comparing HA user ID '%s' with mapping HA ID '%s' -> TaskTracker '%s'",
+                    ha_user_id,
+                    user_ha_id,
+                    user.get(CONF_TASKTRACKER_USERNAME),
+                )
+            if user_ha_id == ha_user_id:
+                username = user.get(CONF_TASKTRACKER_USERNAME)
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Found TaskTracker username '%s' for HA user ID '%s'",
+                        username,
+                        ha_user_id,
+                    )
+                return username
 
     _LOGGER.warning("No TaskTracker username found for HA user ID '%s'", ha_user_id)
     _LOGGER.warning("Available user mappings: %s", users)
@@ -200,17 +306,30 @@ def get_ha_user_for_tasktracker_username(
         Home Assistant user ID if found, None otherwise
 
     """
-    users = config.get(CONF_USERS, [])
-
-    for user in users:
-        if user.get(CONF_TASKTRACKER_USERNAME) == tasktracker_username:
-            ha_user_id = user.get(CONF_HA_USER_ID)
-            _LOGGER.debug(
-                "Found HA user ID '%s' for TaskTracker username '%s'",
-                ha_user_id,
-                tasktracker_username,
-            )
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+
+    user_index = _get_user_index(hass, config)
+    if user_index is not None:
+        ha_user_id = user_index[USER_INDEX_TASKTRACKER_TO_HA].get(tasktracker_username)
+        if ha_user_id is not None:
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Found HA user ID '%s' for TaskTracker username '%s'",
+                    ha_user_id,
+                    tasktracker_username,
+                )
             return ha_user_id
+    else:
+        for user in config.get(CONF_USERS, []):
+            if user.get(CONF_TASKTRACKER_USERNAME) == tasktracker_username:
+                ha_user_id = user.get(CONF_HA_USER_ID)
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Found HA user ID '%s' for TaskTracker username '%s'",
+                        ha_user_id,
+                        tasktracker_username,
+                    )
+                return ha_user_id
 
     _LOGGER.warning(
         "No HA user ID found for TaskTracker username '%s'", tasktracker_username
@@ -261,14 +380,10 @@ def format_task_priority(priority: int) -> str:
         Priority string
 
     """
-    priority_map = {
-        1: "High",
-        2: "Medium",
-        3: "Low",
-        4: "Very Low",
-        5: "Minimal",
-    }
-    return priority_map.get(priority, f"Priority {priority}")
+    # Range membership also matches integral floats such as a decoded 2.0
+    if priority in range(1, len(_PRIORITY_NAMES) + 1):
+        return _PRIORITY_NAMES[int(priority) - 1]
+    return f"Priority {priority}"
 
 
 def get_integration_data(hass: HomeAssistant, entry_id: str) -> dict[str, Any] | None:
@@ -283,7 +398,14 @@ def get_integration_data(hass: HomeAssistant, entry_id: str) -> dict[str, Any] |
         Integration data dictionary or None if not found
 
     """
-    return hass.data.get(DOMAIN, {}).get(entry_id)
+    domain_data = hass.data.get(DOMAIN)
+    return domain_data.get(entry_id) if domain_data else None
+
+
+@lru_cache(maxsize=8)
+def _sorted_unique_usernames(usernames: tuple[str, ...]) -> tuple[str, ...]:
+    """Sort and deduplicate usernames; user mappings rarely change."""
+    return tuple(sorted(set(usernames)))
 
 
 def get_available_tasktracker_usernames(config: dict[str, Any]) -> list[str]:
@@ -298,16 +420,15 @@ def get_available_tasktracker_usernames(config: dict[str, Any]) -> list[str]:
 
     """
     _LOGGER.debug("Getting available TaskTracker usernames from configuration")
-    _LOGGER.debug("Config: %s", config)
-    users = config.get(CONF_USERS, [])
-    usernames = []
-
-    for user in users:
-        username = user.get(CONF_TASKTRACKER_USERNAME)
-        if username and username not in usernames:
-            usernames.append(username)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Config: %s", config)
+    usernames = tuple(
+        username
+        for user in config.get(CONF_USERS, [])
+        if (username := user.get(CONF_TASKTRACKER_USERNAME))
+    )
 
-    return sorted(usernames)
+    return list(_sorted_unique_usernames(usernames))
 
 
 async def validate_user_configuration(
@@ -334,14 +455,15 @@ async def validate_user_configuration(
     # Get all Home Assistant users to validate against
     try:
         ha_users = await hass.auth.async_get_users()
-        ha_user_ids = {user.id for user in ha_users if user.is_active}
-        ha_user_names = {
-            user.name.lower() for user in ha_users if user.is_active and user.name
-        }
     except Exception:  # noqa: BLE001
         # If we can't get HA users, we can't validate
         return True, []
 
+    active_users = [user for user in ha_users if user.is_active]
+    ha_user_ids = {user.id for user in active_users}
+    # Display names are only needed to explain a miss, so build them lazily
+    ha_user_names: set[str] | None = None
+
     for i, user in enumerate(users):
         ha_user_id = user.get(CONF_HA_USER_ID)
         tasktracker_username = user.get(CONF_TASKTRACKER_USERNAME)
@@ -356,6 +478,10 @@ async def validate_user_configuration(
 
         # Check if the ha_user_id looks like a display name instead of a user ID
         if ha_user_id not in ha_user_ids:
+            if ha_user_names is None:
+                ha_user_names = {
+                    ha_user.name.lower() for ha_user in active_users if ha_user.name
+                }
             if ha_user_id.lower() in ha_user_names:
                 issues.append(
                     f"User mapping {i + 1}: '{ha_user_id}' appears to be a display name "
@@ -7,10 +7,13 @@ for figuring out how to register javascript modules automatically.
 This is a modified version of the Wiser code to work with TaskTracker.
 """
 
+import asyncio
 import datetime
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.core import HomeAssistant
@@ -23,6 +26,18 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_WWW_DIR = Path(__file__).parent
+
+# Version query parameter of a registered resource URL
+_VERSION_RE = re.compile(r"[?&]v=([^&?]*)")
+
+# Backoff bounds (seconds) while waiting for lovelace resources to load
+_RESOURCE_POLL_INITIAL_DELAY = 0.5
+_RESOURCE_POLL_MAX_DELAY = 5
+
+# Unversioned resource paths of the modules we ship
+_MODULE_PATHS = frozenset(f"{URL_BASE}/{m.get('filename')}" for m in JSMODULES)
+
 
 class JSModuleRegistration:
     """Register Javascript modules."""
@@ -46,27 +61,32 @@ class JSModuleRegistration:
                 [
                     StaticPathConfig(
                         URL_BASE,
-                        str(Path(__file__).parent),
+                        str(_WWW_DIR),
                         cache_headers=False,
                     )
                 ]
             )
-            _LOGGER.debug("Registered resource path from %s", Path(__file__).parent)
+            _LOGGER.debug("Registered resource path from %s", _WWW_DIR)
         except RuntimeError:
             # Runtime error is likley this is already registered.
             _LOGGER.debug("Resource path already registered")
 
     async def _async_wait_for_lovelace_resources(self) -> None:
         """Wait for lovelace resources to have loaded."""
+        # Poll quickly at first and back off, rather than always waiting 5s
+        delay = _RESOURCE_POLL_INITIAL_DELAY
 
         async def _check_lovelace_resources_loaded(now: datetime.datetime) -> None:
+            nonlocal delay
             if self.lovelace.resources.loaded:
                 await self._async_register_modules()
             else:
                 _LOGGER.debug(
-                    "Lovelace resources have not yet loaded.  Trying again in 5 seconds"
+                    "Lovelace resources have not yet loaded.  Trying again in %s seconds",
+                    delay,
                 )
-                async_call_later(self.hass, 5, _check_lovelace_resources_loaded)
+                async_call_later(self.hass, delay, _check_lovelace_resources_loaded)
+                delay = min(delay * 2, _RESOURCE_POLL_MAX_DELAY)
 
         await _check_lovelace_resources_loaded(datetime.datetime.now())  # noqa: DTZ005
 
@@ -74,102 +94,115 @@ class JSModuleRegistration:
         """Register modules if not already registered."""
         _LOGGER.debug("Installing javascript modules")
 
+        # Walk the resource collection once and share the grouping below
+        resources_by_path = self._collect_tasktracker_resources()
+
         # First, clean up any duplicate or malformed registrations
-        await self._async_cleanup_duplicate_registrations()
+        await self._async_cleanup_duplicate_registrations(resources_by_path)
 
         # Then, remove stale TaskTracker resources that no longer exist in JSMODULES
-        await self._async_remove_stale_resources()
-
-        # Get resources already registered
-        resources = [
-            resource
-            for resource in self.lovelace.resources.async_items()
-            if resource["url"].startswith(URL_BASE)
-        ]
+        await self._async_remove_stale_resources(resources_by_path)
 
         for module in JSMODULES:
+            name = module.get("name")
+            version = module.get("version")
             url = f"{URL_BASE}/{module.get('filename')}"
+            versioned_url = f"{url}?v={module.get('version', '0')}"
+            resources = resources_by_path.get(url)
 
-            card_registered = False
-
-            for resource in resources:
-                resource_url = resource["url"]  # type: ignore[report-type-mismatch]
-                if self._get_resource_path(resource_url) == url:
-                    card_registered = True
-                    # check version
-                    if self._get_resource_version(resource_url) != module.get(
-                        "version"
-                    ):
-                        # Update card version
-                        _LOGGER.debug(
-                            "Updating %s to version %s",
-                            module.get("name"),
-                            module.get("version"),
-                        )
-                        await self.lovelace.resources.async_update_item(
-                            resource.get("id"),
-                            {
-                                "res_type": "module",
-                                "url": url + "?v=" + module.get("version", "0"),
-                            },
-                        )
-                        # Remove old gzipped files
-                        await self.async_remove_gzip_files()
-                    else:
-                        _LOGGER.debug(
-                            "%s already registered as version %s",
-                            module.get("name"),
-                            module.get("version"),
-                        )
-
-            if not card_registered:
-                _LOGGER.debug(
-                    "Registering %s as version %s",
-                    module.get("name"),
-                    module.get("version"),
-                )
+            if not resources:
+                _LOGGER.debug("Registering %s as version %s", name, version)
                 await self.lovelace.resources.async_create_item(
-                    {
-                        "res_type": "module",
-                        "url": url + "?v=" + module.get("version", "0"),
-                    }
-                )
-            else:
-                _LOGGER.debug(
-                    "Skipping %s as it is already registered as version %s",
-                    module.get("name"),
-                    module.get("version"),
+                    {"res_type": "module", "url": versioned_url}
                 )
+                continue
+
+            resource = resources[0]
 
-    def _get_resource_path(self, url: str) -> str:
-        return url.split("?")[0]
-
-    def _get_resource_version(self, url: str) -> str:
-        if "?" in url and "v=" in url:
-            # Split by ? and get the query parameters
-            query_params = url.split("?", 1)[1]
-            # Look for v= parameter in the query string
-            if "v=" in query_params:
-                # Extract just the version part after v=
-                # Handle cases where there might be other parameters after
-                version_part = query_params.split("v=", 1)[1]
-                # Get just the version value, split on both & and ? to handle malformed URLs
-                version = version_part.split("&")[0].split("?")[0]
-                return version  # noqa: RET504
-        return "0"
+            # check version
+            if self._get_resource_version(resource["url"]) != version:
+                # Update card version
+                _LOGGER.debug("Updating %s to version %s", name, version)
+                await self.lovelace.resources.async_update_item(
+                    resource.get("id"),
+                    {"res_type": "module", "url": versioned_url},
+                )
+                # Remove old gzipped files
+                await self.async_remove_gzip_files()
+            else:
+                _LOGGER.debug("%s already registered as version %s", name, version)
+
+    def _collect_tasktracker_resources(self) -> dict[str, list[dict[str, Any]]]:
+        """Group registered TaskTracker resources by their unversioned path."""
+        resources_by_path: dict[str, list[dict[str, Any]]] = {}
+        for resource in self.lovelace.resources.async_items():
+            resource_url = str(resource["url"])
+            if resource_url.startswith(URL_BASE):
+                resources_by_path.setdefault(
+                    self._get_resource_path(resource_url), []
+                ).append(resource)
+        return resources_by_path
+
+    # URLs repeat across passes and reloads; both parsers are pure
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_resource_path(url: str) -> str:
+        return url.split("?", 1)[0]
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_resource_version(url: str) -> str:
+        # First v= query parameter; stops at '?' to handle malformed URLs
+        match = _VERSION_RE.search(url)
+        return match.group(1) if match else "0"
 
     async def async_unregister(self) -> None:
         """Unload lovelace module resource."""
         if self.lovelace.resource_mode == "storage":
-            for module in JSMODULES:
-                url = f"{URL_BASE}/{module.get('filename')}"
-                tasktracker_resources = [
+            resources_by_path = self._collect_tasktracker_resources()
+            await self._async_delete_resources(
+                [
                     resource
-                    for resource in self.lovelace.resources.async_items()
-                    if str(resource["url"]).startswith(url)
-                ]
-                for resource in tasktracker_resources:
-                    await self.lovelace.resources.async_delete_item(resource.get("id"))
+                    for path in _MODULE_PATHS
+                    for resource in resources_by_path.get(path, ())
+                ],
+                "TaskTracker",
+            )
+
+    async def _async_delete_resources(
+        self, resources: list[dict[str, Any]], kind: str
+    ) -> int:
+        """
+        Delete lovelace resources concurrently.
+
+        Args:
+            resources: Resources to delete
+            kind: Description used when logging failed deletions
+
+        Returns:
+            Number of resources deleted
+
+        """
+
+        async def _delete(resource: dict[str, Any]) -> None:
+            await self.lovelace.resources.async_delete_item(resource.get("id"))
+
+        results = await asyncio.gather(
+            *(_delete(resource) for resource in resources), return_exceptions=True
+        )
+
+        removed = 0
+        for resource, result in zip(resources, results, strict=True):
+            if isinstance(result, BaseException):
+                _LOGGER.warning(
+                    "Failed to remove %s resource %s: %s",
+                    kind,
+                    resource.get("url"),
+                    result,
+                )
+            else:
+                removed += 1
+        return removed
 
     async def async_remove_gzip_files(self) -> None:
         """Remove cached gzip files."""
@@ -177,49 +210,40 @@ class JSModuleRegistration:
 
     def remove_gzip_files(self) -> None:
         """Remove cached gzip files."""
-        path = Path(__file__).parent
-
-        gzip_files = [
-            filename for filename in path.iterdir() if filename.suffix == ".gz"
-        ]
-
-        for file in gzip_files:
+        for file in _WWW_DIR.iterdir():
+            if file.suffix != ".gz":
+                continue
             try:
-                if (path / file).stat().st_mtime < (
-                    path / f"{file.with_suffix('')}.gz"
-                ).stat().st_mtime:
+                # Drop compressed copies that predate their source file
+                if file.stat().st_mtime < file.with_suffix("").stat().st_mtime:
                     _LOGGER.debug("Removing older gzip file - %s", file)
-                    (path / file).unlink()
+                    file.unlink()
             except OSError:
                 pass
 
-    async def _async_cleanup_duplicate_registrations(self) -> None:
-        """Clean up duplicate or malformed TaskTracker resource registrations."""
-        _LOGGER.debug("Cleaning up duplicate TaskTracker resource registrations")
+    async def _async_cleanup_duplicate_registrations(
+        self, resources_by_path: dict[str, list[dict[str, Any]]] | None = None
+    ) -> None:
+        """
+        Clean up duplicate or malformed TaskTracker resource registrations.
 
-        # Get all TaskTracker resources
-        all_tasktracker_resources = [
-            resource
-            for resource in self.lovelace.resources.async_items()
-            if resource["url"].startswith(URL_BASE)
-        ]
+        Args:
+            resources_by_path: Grouping from ``_collect_tasktracker_resources``;
+                collected here if not given. Updated in place to keep only the
+                surviving registration for each path.
 
-        if not all_tasktracker_resources:
-            return
+        """
+        _LOGGER.debug("Cleaning up duplicate TaskTracker resource registrations")
 
-        # Group resources by base filename
-        resources_by_file = {}
-        for resource in all_tasktracker_resources:
-            resource_url = resource["url"]
-            base_path = self._get_resource_path(resource_url)
+        if resources_by_path is None:
+            resources_by_path = self._collect_tasktracker_resources()
 
-            if base_path not in resources_by_file:
-                resources_by_file[base_path] = []
-            resources_by_file[base_path].append(resource)
+        if not resources_by_path:
+            return
 
-        # Clean up each file group
-        total_removed = 0
-        for base_path, resource_list in resources_by_file.items():
+        # Pick the registration to keep for each file group
+        resources_to_remove = []
+        for base_path, resource_list in resources_by_path.items():
             if len(resource_list) <= 1:
                 continue  # No duplicates for this file
 
@@ -231,35 +255,26 @@ class JSModuleRegistration:
 
             # Find the best registration (prefer clean version format)
             best_resource = None
-            resources_to_remove = []
+            best_is_clean = False
 
             for resource in resource_list:
-                resource_url = resource["url"]
-
                 # Check if this is a clean version format (single ?v=)
-                is_clean = "?v=" in resource_url and resource_url.count("?v=") == 1
+                is_clean = resource["url"].count("?v=") == 1
 
-                if best_resource is None or (
-                    is_clean and not best_resource.get("_is_clean", False)
-                ):
+                if best_resource is None or (is_clean and not best_is_clean):
                     if best_resource is not None:
                         resources_to_remove.append(best_resource)
                     best_resource = resource
-                    best_resource["_is_clean"] = is_clean
+                    best_is_clean = is_clean
                 else:
                     resources_to_remove.append(resource)
 
-            # Remove duplicate/malformed resources
-            for resource in resources_to_remove:
-                try:
-                    await self.lovelace.resources.async_delete_item(resource.get("id"))
-                    total_removed += 1
-                except Exception as e:  # noqa: BLE001
-                    _LOGGER.warning(
-                        "Failed to remove duplicate resource %s: %s",
-                        resource.get("url"),
-                        e,
-                    )
+            resources_by_path[base_path] = [best_resource]
+
+        # Remove duplicate/malformed resources
+        total_removed = await self._async_delete_resources(
+            resources_to_remove, "duplicate"
+        )
 
         if total_removed > 0:
             _LOGGER.info(
@@ -267,30 +282,32 @@ class JSModuleRegistration:
                 total_removed,
             )
 
-    async def _async_remove_stale_resources(self) -> None:
-        """Remove TaskTracker resources that are no longer in JSMODULES."""
+    async def _async_remove_stale_resources(
+        self, resources_by_path: dict[str, list[dict[str, Any]]] | None = None
+    ) -> None:
+        """
+        Remove TaskTracker resources that are no longer in JSMODULES.
+
+        Args:
+            resources_by_path: Grouping from ``_collect_tasktracker_resources``;
+                collected here if not given. Stale paths are dropped from it.
+
+        """
         if self.lovelace.resource_mode != "storage":
             return
 
-        allowed_paths = {f"{URL_BASE}/{m.get('filename')}" for m in JSMODULES}
+        if resources_by_path is None:
+            resources_by_path = self._collect_tasktracker_resources()
 
         stale = [
             resource
-            for resource in self.lovelace.resources.async_items()
-            if str(resource["url"]).startswith(URL_BASE)
-            and self._get_resource_path(str(resource["url"])) not in allowed_paths
+            for base_path in list(resources_by_path)
+            if base_path not in _MODULE_PATHS
+            for resource in resources_by_path.pop(base_path)
         ]
 
         if not stale:
             return
 
         _LOGGER.info("Removing %d stale TaskTracker resources", len(stale))
-        for resource in stale:
-            try:
-                await self.lovelace.resources.async_delete_item(resource.get("id"))
-            except Exception as e:  # noqa: BLE001
-                _LOGGER.warning(
-                    "Failed to remove stale resource %s: %s",
-                    resource.get("url"),
-                    e,
-                )
+        await self._async_delete_resources(stale, "stale")
@@ -17,6 +17,7 @@ def run_tests() -> int:
     try:
         import pytest  # noqa: F401
         import pytest_homeassistant_custom_component  # noqa: F401
+        import xdist  # noqa: F401
     except ImportError as e:
         print(  # noqa: T201
             "Error: Missing test dependencies. Run: pip install -r requirements-test.txt"
@@ -26,7 +27,7 @@ def run_tests() -> int:
 
     print("🧪 Running TaskTracker integration tests...")  # noqa: T201
 
-    # Run pytest (coverage configured in pytest.ini)
+    # Run pytest (coverage and pytest-xdist distribution configured in pytest.ini)
     cmd = [
         sys.executable,
         "-m",
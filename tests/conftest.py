@@ -1,28 +1,44 @@
 """Fixtures for TaskTracker integration tests."""
 
-from collections.abc import Generator
+import copy
+import re
+from collections.abc import AsyncGenerator, Callable, Generator
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+import pytest_asyncio
+from aiohttp import ClientSession
+from aiohttp.hdrs import METH_GET, METH_POST
+from aioresponses import aioresponses
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.tasktracker.api import TaskTrackerAPI
 from custom_components.tasktracker.const import DOMAIN
 
+from .const import TEST_API_KEY, TEST_HOST
+
 
 @pytest.fixture(autouse=True)
-def auto_enable_custom_integrations(
-    enable_custom_integrations: bool,
-) -> Generator[None]:
+def auto_enable_custom_integrations(request: pytest.FixtureRequest) -> None:
     """Enable custom integrations defined in the test dir."""
-    yield  # noqa: PT022
+    # enable_custom_integrations pulls in hass; skip it for plain unit tests
+    if "hass" in request.fixturenames:
+        request.getfixturevalue("enable_custom_integrations")
 
 
 @pytest.fixture(autouse=True)
-def mock_conversation_dependency() -> Generator[None]:
+def mock_conversation_dependency(
+    request: pytest.FixtureRequest,
+) -> Generator[MagicMock | None]:
     """Mock the conversation component to prevent test failures."""
+    if "hass" not in request.fixturenames:
+        # Plain unit tests never set up Home Assistant components
+        yield None
+        return
+
     with patch("homeassistant.setup.async_setup_component") as mock_setup:
         # Mock successful setup for conversation component
         async def setup_side_effect(
@@ -38,30 +54,69 @@ def mock_conversation_dependency() -> Generator[None]:
         yield mock_setup
 
 
+@pytest.fixture(scope="session")
+def config_entry_data() -> dict[str, Any]:
+    """Config entry data template; copy it before handing it to a test."""
+    return {
+        "host": TEST_HOST,
+        "api_key": TEST_API_KEY,
+        "users": [{"ha_user_id": "test-user-1", "tasktracker_username": "testuser1"}],
+    }
+
+
 @pytest.fixture
-def mock_config_entry() -> MockConfigEntry:
+def mock_config_entry(config_entry_data: dict[str, Any]) -> MockConfigEntry:
     """Create a mock config entry for testing."""
     return MockConfigEntry(
         domain=DOMAIN,
-        data={
-            "host": "https://test.example.com",
-            "api_key": "test-api-key",
-            "users": [
-                {"ha_user_id": "test-user-1", "tasktracker_username": "testuser1"}
-            ],
-        },
+        data=copy.deepcopy(config_entry_data),
         entry_id="test",
         title="TaskTracker Test",
     )
 
 
+# Every TaskTracker endpoint lives under the test host
+_API_URL = re.compile(rf"^{re.escape(TEST_HOST)}/")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_client() -> AsyncGenerator[TaskTrackerAPI]:
+    """
+    Create an API client with a real session; mock it with ``mock_request``.
+
+    The client is shared by the whole session, so tests using it must run
+    on the session event loop (``pytest.mark.asyncio(loop_scope="session")``).
+    """
+    async with ClientSession() as session:
+        yield TaskTrackerAPI(session=session, host=TEST_HOST, api_key=TEST_API_KEY)
+
+
 @pytest.fixture
-def mock_api_response() -> dict[str, Any]:
-    """Mock API response data."""
-    return {
-        "success": True,
-        "spoken_response": "Operation completed successfully",
-        "data": {
-            "completion": {"task_id": 123, "name": "Test Task", "completed": True}
-        },
-    }
+def mock_aioresponse() -> Generator[aioresponses]:
+    """Intercept aiohttp requests; sent requests are in ``.requests``."""
+    with aioresponses() as mocked:
+        yield mocked
+
+
+@pytest.fixture
+def mock_request(mock_aioresponse: aioresponses) -> Callable[..., None]:
+    """Return a helper that sets the response for every TaskTracker API call."""
+
+    def _mock_request(
+        status: int = 200,
+        payload: dict[str, Any] | None = None,
+        exception: Exception | None = None,
+    ) -> None:
+        if payload is None:
+            payload = {"success": True, "data": {}}
+        for method in (METH_GET, METH_POST):
+            mock_aioresponse.add(
+                _API_URL,
+                method=method,
+                status=status,
+                payload=payload,
+                exception=exception,
+                repeat=True,
+            )
+
+    return _mock_request
@@ -0,0 +1,5 @@
+"""Constants shared by the TaskTracker tests."""
+
+TEST_HOST = "https://test.example.com"
+TEST_API_KEY = "test-api-key"
+TEST_HEADERS = {"X-API-Key": TEST_API_KEY, "Content-Type": "application/json"}
@@ -0,0 +1,48 @@
+"""Tests for TaskTracker API client error handling."""
+
+from collections.abc import Callable
+
+import pytest
+from aiohttp import ClientError
+
+from custom_components.tasktracker.api import TaskTrackerAPI, TaskTrackerAPIError
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestTaskTrackerAPIErrors:
+    """Test TaskTracker API client error handling."""
+
+    @pytest.mark.parametrize(
+        ("status", "error", "message"),
+        [
+            pytest.param(
+                400, None, "API request failed with status 400", id="status_400"
+            ),
+            pytest.param(
+                500, None, "API request failed with status 500", id="status_500"
+            ),
+            pytest.param(
+                200, ClientError("Network error"), "Network error", id="network"
+            ),
+            pytest.param(
+                200, ClientError("Request timed out"), "Network error", id="timeout"
+            ),
+        ],
+    )
+    async def test_request_error_handling(
+        self,
+        api_client: TaskTrackerAPI,
+        mock_request: Callable[..., None],
+        status: int,
+        error: Exception | None,
+        message: str,
+    ) -> None:
+        """Test error statuses and network errors raise TaskTrackerAPIError."""
+        mock_request(status, {"error": "Request failed"}, exception=error)
+
+        with pytest.raises(TaskTrackerAPIError) as exc_info:
+            await api_client.complete_task(
+                task_id=123, task_type="RecurringTask", completed_by="testuser"
+            )
+
+        assert message in str(exc_info.value)
@@ -0,0 +1,326 @@
+"""Tests for TaskTracker API client requests that succeed."""
+
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+
+from custom_components.tasktracker.api import TaskTrackerAPI
+
+from .const import TEST_API_KEY, TEST_HEADERS, TEST_HOST
+
+
+def _success(spoken_response: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Build a successful API response payload."""
+    return {"success": True, "spoken_response": spoken_response, "data": data}
+
+
+# Payloads shared by several cases; the API returns a fresh decoded copy
+TASK_COMPLETED = _success(
+    "Task completed successfully",
+    {"completion": {"task_id": 123, "completed": True}},
+)
+LEFTOVER_CREATED = _success(
+    "Leftover created successfully", {"leftover": {"id": 456, "name": "pizza"}}
+)
+ADHOC_TASK_CREATED = _success(
+    "Task created successfully", {"task": {"id": 789, "name": "adhoc task"}}
+)
+
+# (method, kwargs, response status, response payload)
+SUCCESS_CASES = [
+    pytest.param(
+        "complete_task",
+        {"task_id": 123, "task_type": "RecurringTask", "completed_by": "testuser"},
+        200,
+        TASK_COMPLETED,
+        id="complete_task_without_notes",
+    ),
+    pytest.param(
+        "complete_task_by_name",
+        {"name": "trash", "completed_by": "testuser"},
+        200,
+        _success(
+            "Task completed successfully",
+            {"completion": {"name": "trash", "completed": True}},
+        ),
+        id="complete_task_by_name",
+    ),
+    pytest.param(
+        "create_leftover",
+        {"name": "pizza", "assigned_users": ["testuser"], "shelf_life_days": 3},
+        201,
+        LEFTOVER_CREATED,
+        id="create_leftover",
+    ),
+    pytest.param(
+        "create_leftover",
+        {"name": "pizza"},
+        201,
+        LEFTOVER_CREATED,
+        id="create_leftover_minimal_params",
+    ),
+    pytest.param(
+        "create_adhoc_task",
+        {"name": "adhoc task", "assigned_users": ["testuser"], "duration_minutes": 30},
+        201,
+        ADHOC_TASK_CREATED,
+        id="create_adhoc_task",
+    ),
+    pytest.param(
+        "create_adhoc_task",
+        {"name": "adhoc task", "assigned_users": ["testuser"]},
+        201,
+        ADHOC_TASK_CREATED,
+        id="create_adhoc_task_minimal_params",
+    ),
+    pytest.param(
+        "get_recommended_tasks",
+        {"username": "testuser", "available_minutes": 30},
+        200,
+        _success(
+            "Found 2 recommended tasks",
+            {
+                "items": [
+                    {"id": 1, "name": "Quick task", "duration": 15},
+                    {"id": 2, "name": "Medium task", "duration": 30},
+                ],
+                "count": 2,
+            },
+        ),
+        id="get_recommended_tasks",
+    ),
+    pytest.param(
+        "get_recommended_tasks",
+        {"username": "testuser", "available_minutes": 30},
+        200,
+        _success("No recommended tasks found", {"items": [], "count": 0}),
+        id="get_recommended_tasks_empty",
+    ),
+    pytest.param(
+        "get_available_tasks",
+        {"username": "testuser"},
+        200,
+        _success(
+            "Found 1 available task",
+            {"items": [{"id": 1, "name": "Task 1"}], "count": 1},
+        ),
+        id="get_available_tasks",
+    ),
+    pytest.param(
+        "get_available_tasks",
+        {},
+        200,
+        _success("No available tasks found", {"items": [], "count": 0}),
+        id="get_available_tasks_no_params",
+    ),
+    pytest.param(
+        "get_recent_completions",
+        {"username": "testuser", "limit": 10},
+        200,
+        _success(
+            "Found 1 recent completion",
+            {"completions": [{"id": 1, "task_name": "Completed Task"}], "count": 1},
+        ),
+        id="get_recent_completions",
+    ),
+    pytest.param(
+        "get_recent_completions",
+        {},
+        200,
+        _success("No recent completions found", {"completions": [], "count": 0}),
+        id="get_recent_completions_no_params",
+    ),
+    pytest.param(
+        "list_leftovers",
+        {},
+        200,
+        _success(
+            "Found 1 leftover", {"leftovers": [{"id": 1, "name": "pizza"}], "count": 1}
+        ),
+        id="list_leftovers",
+    ),
+    pytest.param(
+        "get_all_tasks",
+        {"username": "testuser"},
+        200,
+        _success("Found 1 task", {"tasks": [{"id": 1, "name": "Task 1"}], "count": 1}),
+        id="get_all_tasks_with_username",
+    ),
+    pytest.param(
+        "get_all_tasks",
+        {},
+        200,
+        _success("No tasks found", {"tasks": [], "count": 0}),
+        id="get_all_tasks_no_params",
+    ),
+    pytest.param(
+        "query_task",
+        {"name": "leftover pizza", "question_type": "safety"},
+        200,
+        _success(
+            "Found answer to the query",
+            {"answer": "This leftover is still safe to eat"},
+        ),
+        id="query_task_with_question_type",
+    ),
+    pytest.param(
+        "query_task",
+        {"name": "leftover pizza"},
+        200,
+        _success(
+            "Found answer to the query",
+            {"answer": "General information about the task"},
+        ),
+        id="query_task_without_question_type",
+    ),
+]
+
+
+COMPLETE_TASK_URL = f"{TEST_HOST}/api/completions/complete_task/"
+COMPLETE_TASK_BODY = {
+    "task_id": 123,
+    "task_type": "RecurringTask",
+    "completed_by": "testuser",
+    "notes": "Test completion",
+}
+
+
+def _sent_requests(mocked: aioresponses) -> list[tuple[str, str, Any]]:
+    """Flatten the requests aioresponses recorded into (method, url, call)."""
+    return [
+        (method, str(url), call)
+        for (method, url), calls in mocked.requests.items()
+        for call in calls
+    ]
+
+
+class TestTaskTrackerAPISetup:
+    """Test TaskTracker API client construction."""
+
+    def test_headers_formation(self) -> None:
+        """Test that headers are correctly formed."""
+        api = TaskTrackerAPI(session=Mock(), host=TEST_HOST, api_key=TEST_API_KEY)
+        headers = api._get_headers()  # noqa: SLF001
+        assert headers == TEST_HEADERS
+        # Built once per client, not per request
+        assert api._get_headers() is headers  # noqa: SLF001
+
+    def test_host_stripping(self) -> None:
+        """Test that trailing slash is stripped from host."""
+        api = TaskTrackerAPI(
+            session=Mock(),
+            host=f"{TEST_HOST}/",
+            api_key=TEST_API_KEY,
+        )
+        assert api.host == TEST_HOST
+
+
+# No test here does real I/O, so one event loop (and session) serves them all
+@pytest.mark.asyncio(loop_scope="session")
+class TestTaskTrackerAPI:
+    """Test TaskTracker API client."""
+
+    async def test_complete_task_success(
+        self,
+        api_client: TaskTrackerAPI,
+        mock_request: Callable[..., None],
+        mock_aioresponse: aioresponses,
+    ) -> None:
+        """Test successful task completion."""
+        mock_request(200, TASK_COMPLETED)
+
+        result = await api_client.complete_task(**COMPLETE_TASK_BODY)
+
+        assert result["success"] is True
+        assert result["data"]["completion"]["task_id"] == 123
+
+        # Verify the request was made correctly
+        ((method, url, call),) = _sent_requests(mock_aioresponse)
+        assert method == "POST"
+        assert url == COMPLETE_TASK_URL
+        assert call.kwargs["headers"] == TEST_HEADERS
+        assert call.kwargs["params"] is None
+        assert call.kwargs["json"] == COMPLETE_TASK_BODY
+
+    async def test_session_is_reused(
+        self,
+        api_client: TaskTrackerAPI,
+        mock_request: Callable[..., None],
+        mock_aioresponse: aioresponses,
+    ) -> None:
+        """Test the client keeps using the session it was given."""
+        mock_request()
+        session = api_client.session
+
+        # Home Assistant owns the pooled session; the client must neither
+        # open its own nor close the shared one between calls
+        with (
+            patch(
+                "custom_components.tasktracker.api.aiohttp.ClientSession",
+                side_effect=AssertionError("API created its own session"),
+            ),
+            patch.object(ClientSession, "close", new_callable=AsyncMock) as close,
+        ):
+            await api_client.get_all_tasks()
+            await api_client.get_all_tasks()
+
+        close.assert_not_awaited()
+        assert api_client.session is session
+        assert not session.closed
+        assert len(_sent_requests(mock_aioresponse)) == 2
+
+    @pytest.mark.parametrize(("method", "kwargs", "status", "payload"), SUCCESS_CASES)
+    async def test_request_success(
+        self,
+        api_client: TaskTrackerAPI,
+        mock_request: Callable[..., None],
+        mock_aioresponse: aioresponses,
+        method: str,
+        kwargs: dict[str, Any],
+        status: int,
+        payload: dict[str, Any],
+    ) -> None:
+        """Test API methods return the decoded payload on success."""
+        mock_request(status, payload)
+
+        result = await getattr(api_client, method)(**kwargs)
+
+        assert result == payload
+        assert len(_sent_requests(mock_aioresponse)) == 1
+
+    async def test_create_adhoc_task_sends_required_assigned_to_field(
+        self,
+        api_client: TaskTrackerAPI,
+        mock_request: Callable[..., None],
+        mock_aioresponse: aioresponses,
+    ) -> None:
+        """Test that create_adhoc_task sends both assigned_to (required) and assigned_users."""
+        mock_request(201, ADHOC_TASK_CREATED)
+
+        result = await api_client.create_adhoc_task(
+            name="test task",
+            assigned_users=["testuser"],
+            duration_minutes=45,
+            priority=1,
+        )
+
+        assert result["success"] is True
+
+        # Verify the request was made with BOTH assigned_to and assigned_users
+        # The server requires assigned_to as a mandatory field per CreateAdHocTaskSerializer
+        ((_, _, call),) = _sent_requests(mock_aioresponse)
+
+        # Extract the json data parameter
+        json_data = call.kwargs["json"]
+
+        # Server requires 'assigned_to' field (single user, required by serializer)
+        assert "assigned_to" in json_data, "assigned_to field is required by server but not sent"
+        assert json_data["assigned_to"] == "testuser", "assigned_to should be the first user"
+
+        # Server accepts 'assigned_users' field (list, optional for multi-user support)
+        assert "assigned_users" in json_data, "assigned_users should be sent for multi-user support"
+        assert json_data["assigned_users"] == ["testuser"], "assigned_users should match input"
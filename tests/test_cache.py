@@ -1,10 +1,37 @@
 """Tests for TaskTracker cache functionality."""
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
+import pytest_asyncio
 from custom_components.tasktracker.cache import TaskTrackerCache
 
+# Cache tests never touch hass, so they can share the session event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+WARM_ENTRIES = {
+    "user:alice:tasks": {"data": "alice_tasks"},
+    "user:alice:plan": {"data": "alice_plan"},
+    "user:bob:tasks": {"data": "bob_tasks"},
+    "user:bob:plan": {"data": "bob_plan"},
+}
+
+
+@pytest.fixture
+def empty_cache():
+    """Create an empty cache."""
+    return TaskTrackerCache()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def warm_cache():
+    """Create a cache pre-populated with WARM_ENTRIES."""
+    cache = TaskTrackerCache()
+    await asyncio.gather(*(cache.set(k, v) for k, v in WARM_ENTRIES.items()))
+    return cache
+
 
-@pytest.mark.asyncio
 async def test_cache_get_set():
     """Test basic cache get and set operations."""
     cache = TaskTrackerCache()
@@ -18,103 +45,263 @@ async def test_cache_get_set():
     assert result["data"] == "test_value"
 
 
-@pytest.mark.asyncio
-async def test_cache_miss():
-    """Test cache miss returns None."""
-    cache = TaskTrackerCache()
+async def test_cache_get_sync(warm_cache):
+    """Test the synchronous lookup matches get()."""
+    assert warm_cache.get_sync("user:alice:tasks", ttl=60) == {"data": "alice_tasks"}
+    assert warm_cache.get_sync("nonexistent_key", ttl=60) is None
+
 
-    result = await cache.get("nonexistent_key", ttl=60)
+async def test_cache_miss(empty_cache):
+    """Test cache miss returns None."""
+    result = await empty_cache.get("nonexistent_key", ttl=60)
     assert result is None
 
 
-@pytest.mark.asyncio
-async def test_cache_expiration(monkeypatch):
+async def test_cache_expiration():
     """Test cache expiration after TTL."""
-    import time
-    cache = TaskTrackerCache()
-
-    # Set a value
-    await cache.set("test_key", {"data": "test_value"})
-
-    # Mock time to simulate TTL expiration
-    original_time = time.time
+    now = [1000.0]
+    cache = TaskTrackerCache(clock=lambda: now[0])
     await cache.set("test_key", {"data": "test_value"})
 
-    # Artificially age the cache entry
-    cache._timestamps["test_key"] = original_time() - 100
+    # Still fresh just inside the TTL
+    now[0] += 49
+    assert await cache.get("test_key", ttl=50) is not None
 
-    # Attempt to get with shorter TTL
-    result = await cache.get("test_key", ttl=50)
-    assert result is None
+    now[0] += 1
+    assert await cache.get("test_key", ttl=50) is None
 
 
-@pytest.mark.asyncio
-async def test_cache_invalidate_all():
-    """Test invalidating all cache entries."""
-    cache = TaskTrackerCache()
+async def test_cache_set_prunes_expired_entries():
+    """Test writes drop entries whose write-time TTL has passed."""
+    now = [1000.0]
+    cache = TaskTrackerCache(clock=lambda: now[0])
+    await cache.set("short", {"data": "short"}, ttl=10)
+    await cache.set("long", {"data": "long"}, ttl=60)
+    await cache.set("untimed", {"data": "untimed"})
 
-    # Set multiple values
-    await cache.set("key1", {"data": "value1"})
-    await cache.set("key2", {"data": "value2"})
-    await cache.set("key3", {"data": "value3"})
+    now[0] += 30
+    await cache.set("other", {"data": "other"})
 
+    stats = await cache.get_stats()
+    assert stats["total_entries"] == 3
+    assert await cache.get("short", ttl=3600) is None
+    assert await cache.get("long", ttl=3600) is not None
+    assert await cache.get("untimed", ttl=3600) is not None
+
+
+@pytest.mark.parametrize(("draw", "expires_at"), [(min, 85), (max, 100)])
+async def test_cache_ttl_jitter_bounds(draw, expires_at):
+    """Test a write-time TTL expires within its jitter window, never after."""
+    now = [1000.0]
+    cache = TaskTrackerCache(clock=lambda: now[0], ttl_jitter=0.15)
+    # Pin the jitter draw to either end of the window
+    with patch(
+        "custom_components.tasktracker.cache.random.uniform",
+        side_effect=lambda a, b: draw(a, b),
+    ):
+        await cache.set("k", {"data": "v"}, ttl=100)
+
+    now[0] += expires_at - 0.1
+    assert cache.get_sync("k", ttl=3600) is not None
+    now[0] += 0.1
+    assert cache.get_sync("k", ttl=3600) is None
+
+
+async def test_cache_ttl_jitter_window():
+    """Test jittered entries all outlive (1 - ttl_jitter) * TTL and none TTL."""
+    now = [1000.0]
+    cache = TaskTrackerCache(clock=lambda: now[0], ttl_jitter=0.15)
+    keys = [f"k:{i}" for i in range(200)]
+    await cache.set_many(dict.fromkeys(keys, {"data": "v"}), ttl=100)
+
+    now[0] += 85 - 0.001
+    assert all(cache.get_sync(k, ttl=3600) is not None for k in keys)
+    now[0] += 15.001
+    assert all(cache.get_sync(k, ttl=3600) is None for k in keys)
+
+
+async def test_cache_get_or_fetch_coalesces_concurrent_misses(empty_cache):
+    """Test concurrent misses for one key share a single fetch."""
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"data": "fetched"}
+
+    waiters = [
+        asyncio.create_task(empty_cache.get_or_fetch("k", 60, fetch))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [{"data": "fetched"}] * 5
+    assert calls == 1
+    assert await empty_cache.get_or_fetch("k", 60, fetch) == {"data": "fetched"}
+    assert calls == 1
+
+
+async def test_cache_get_or_fetch_shares_errors_and_skips_cache(empty_cache):
+    """Test a failed fetch reaches every waiter and is not cached."""
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        raise RuntimeError("boom")
+
+    waiters = [
+        asyncio.create_task(empty_cache.get_or_fetch("k", 60, fetch))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await empty_cache.get("k", ttl=60) is None
+
+
+async def test_cache_get_or_fetch_survives_cancelled_owner(empty_cache):
+    """Test cancelling the caller that started a fetch spares its joiners."""
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"data": "fetched"}
+
+    owner = asyncio.create_task(empty_cache.get_or_fetch("k", 60, fetch))
+    await asyncio.sleep(0)
+    joiners = [
+        asyncio.create_task(empty_cache.get_or_fetch("k", 60, fetch))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    release.set()
+
+    assert await asyncio.gather(*joiners) == [{"data": "fetched"}] * 2
+    assert calls == 1
+    assert await empty_cache.get("k", ttl=60) == {"data": "fetched"}
+
+
+async def test_cache_invalidate_during_fetch(empty_cache):
+    """Test callers after an invalidation do not get the older fetch's data."""
+    release_old = asyncio.Event()
+
+    async def fetch_old():
+        await release_old.wait()
+        return {"v": "old"}
+
+    async def fetch_new():
+        return {"v": "new"}
+
+    old = asyncio.create_task(empty_cache.get_or_fetch("plan:alice", 60, fetch_old))
+    await asyncio.sleep(0)
+    await empty_cache.invalidate_many([":alice"])
+
+    assert await empty_cache.get_or_fetch("plan:alice", 60, fetch_new) == {
+        "v": "new"
+    }
+    release_old.set()
+    assert await old == {"v": "old"}
+    assert empty_cache.get_sync("plan:alice", ttl=60) == {"v": "new"}
+
+    # A fetch superseded by clearing the whole cache is not stored either
+    release_old.clear()
+    old = asyncio.create_task(empty_cache.get_or_fetch("plan:bob", 60, fetch_old))
+    await asyncio.sleep(0)
+    await empty_cache.invalidate()
+    release_old.set()
+    await old
+    assert empty_cache.get_sync("plan:bob", ttl=60) is None
+
+
+async def test_cache_get_or_fetch_force_refresh_skips_inflight(empty_cache):
+    """Test a forced refresh starts its own fetch and its result wins."""
+    release_old = asyncio.Event()
+
+    async def fetch_old():
+        await release_old.wait()
+        return {"v": "old"}
+
+    async def fetch_new():
+        return {"v": "new"}
+
+    old = asyncio.create_task(empty_cache.get_or_fetch("k", 60, fetch_old))
+    await asyncio.sleep(0)
+
+    assert await empty_cache.get_or_fetch(
+        "k", 60, fetch_new, force_refresh=True
+    ) == {"v": "new"}
+    release_old.set()
+    assert await old == {"v": "old"}
+    assert empty_cache.get_sync("k", ttl=60) == {"v": "new"}
+
+
+async def test_cache_invalidate_all(warm_cache):
+    """Test invalidating all cache entries."""
     # Invalidate all
-    await cache.invalidate()
+    await warm_cache.invalidate()
 
     # Verify all are gone
-    assert await cache.get("key1", ttl=60) is None
-    assert await cache.get("key2", ttl=60) is None
-    assert await cache.get("key3", ttl=60) is None
+    for key in WARM_ENTRIES:
+        assert await warm_cache.get(key, ttl=60) is None
 
 
-@pytest.mark.asyncio
-async def test_cache_invalidate_pattern():
+async def test_cache_invalidate_pattern(warm_cache):
     """Test invalidating cache entries by pattern."""
-    cache = TaskTrackerCache()
-
-    # Set multiple values with different patterns
-    await cache.set("user:alice:tasks", {"data": "alice_tasks"})
-    await cache.set("user:alice:plan", {"data": "alice_plan"})
-    await cache.set("user:bob:tasks", {"data": "bob_tasks"})
-    await cache.set("user:bob:plan", {"data": "bob_plan"})
-
     # Invalidate only alice's entries
-    await cache.invalidate(pattern=":alice")
+    await warm_cache.invalidate(pattern=":alice")
 
     # Verify alice's entries are gone
-    assert await cache.get("user:alice:tasks", ttl=60) is None
-    assert await cache.get("user:alice:plan", ttl=60) is None
+    assert await warm_cache.get("user:alice:tasks", ttl=60) is None
+    assert await warm_cache.get("user:alice:plan", ttl=60) is None
 
     # Verify bob's entries remain
-    assert await cache.get("user:bob:tasks", ttl=60) is not None
-    assert await cache.get("user:bob:plan", ttl=60) is not None
+    assert await warm_cache.get("user:bob:tasks", ttl=60) is not None
+    assert await warm_cache.get("user:bob:plan", ttl=60) is not None
 
 
-@pytest.mark.asyncio
-async def test_cache_stats():
-    """Test cache statistics."""
-    cache = TaskTrackerCache()
+async def test_cache_invalidate_matches_whole_segments(warm_cache):
+    """Test namespace and username patterns match whole key segments."""
+    await warm_cache.set("user:alicia:tasks", {"data": "alicia_tasks"})
+    await warm_cache.set("users:alice", {"data": "users"})
 
-    # Empty cache
-    stats = await cache.get_stats()
+    await warm_cache.invalidate(pattern=":alice")
+    assert await warm_cache.get("user:alicia:tasks", ttl=60) is not None
+    assert await warm_cache.get("users:alice", ttl=60) is None
+
+    await warm_cache.invalidate(pattern="user:")
+    stats = await warm_cache.get_stats()
     assert stats["total_entries"] == 0
 
-    # Add some entries
-    await cache.set("key1", {"data": "value1"})
-    await cache.set("key2", {"data": "value2"})
 
-    stats = await cache.get_stats()
-    assert stats["total_entries"] == 2
+async def test_cache_stats_empty(empty_cache):
+    """Test cache statistics for an empty cache."""
+    stats = await empty_cache.get_stats()
+    assert stats["total_entries"] == 0
+
+
+async def test_cache_stats(warm_cache):
+    """Test cache statistics."""
+    stats = await warm_cache.get_stats()
+    assert stats["total_entries"] == len(WARM_ENTRIES)
     assert stats["oldest_age"] >= 0
     assert stats["newest_age"] >= 0
     assert stats["average_age"] >= 0
 
 
-@pytest.mark.asyncio
 async def test_cache_concurrent_access():
     """Test cache with concurrent access."""
-    import asyncio
-
     cache = TaskTrackerCache()
 
     async def writer(key, value):
@@ -126,16 +313,14 @@ async def test_cache_concurrent_access():
         if result is not None:
             assert result == expected
 
-    # Write and read concurrently
-    tasks = []
-    for i in range(10):
-        tasks.append(writer(f"key{i}", {"data": f"value{i}"}))
-        tasks.append(reader(f"key{i}", {"data": f"value{i}"}))
-
-    await asyncio.gather(*tasks)
+    # Write and read concurrently; enough tasks to contend for the lock
+    async with asyncio.TaskGroup() as tg:
+        for i in range(100):
+            tg.create_task(writer(f"key{i}", {"data": f"value{i}"}))
+            tg.create_task(reader(f"key{i}", {"data": f"value{i}"}))
 
     # Verify all entries exist after concurrent operations
-    for i in range(10):
+    for i in range(100):
         result = await cache.get(f"key{i}", ttl=60)
         assert result is not None
         assert result["data"] == f"value{i}"
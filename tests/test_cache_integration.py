@@ -2,12 +2,9 @@
 
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
 from custom_components.tasktracker.const import DOMAIN
 
 
-@pytest.mark.asyncio
 async def test_daily_plan_uses_coordinator(hass, mock_config_entry):
     """Test that daily plan service uses coordinator when available."""
     mock_config_entry.add_to_hass(hass)
@@ -47,7 +44,6 @@ async def test_daily_plan_uses_coordinator(hass, mock_config_entry):
         assert response is not None
 
 
-@pytest.mark.asyncio
 async def test_encouragement_uses_cache(hass, mock_config_entry):
     """Test that encouragement service uses cache."""
     mock_config_entry.add_to_hass(hass)
@@ -95,7 +91,6 @@ async def test_encouragement_uses_cache(hass, mock_config_entry):
         assert mock_encouragement.call_count == 1
 
 
-@pytest.mark.asyncio
 async def test_cache_invalidation_on_task_completion(hass, mock_config_entry):
     """Test that cache is invalidated when task is completed."""
     mock_config_entry.add_to_hass(hass)
@@ -138,7 +133,6 @@ async def test_cache_invalidation_on_task_completion(hass, mock_config_entry):
         assert await cache.get("test:testuser1", ttl=300) is None
 
 
-@pytest.mark.asyncio
 async def test_force_refresh_bypasses_cache(hass, mock_config_entry):
     """Test that force_refresh parameter bypasses cache."""
     mock_config_entry.add_to_hass(hass)
@@ -186,7 +180,6 @@ async def test_force_refresh_bypasses_cache(hass, mock_config_entry):
         assert mock_encouragement.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_coordinator_background_refresh(hass, mock_config_entry):
     """Test that coordinator performs background refreshes."""
     mock_config_entry.add_to_hass(hass)
@@ -1,23 +1,19 @@
 """Test cache invalidation service."""
 
-import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from homeassistant.core import HomeAssistant, ServiceCall
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch, sentinel
 
 from custom_components.tasktracker.service_handlers.cache import (
     invalidate_cache_handler_factory,
 )
 
 
-@pytest.mark.asyncio
 async def test_invalidate_cache_service_calls_invalidate_all_caches():
     """Test that the invalidate_cache service calls invalidate_all_user_caches."""
-    # Create mock hass
-    hass = MagicMock(spec=HomeAssistant)
-
-    # Create service call
-    call = MagicMock(spec=ServiceCall)
-    call.hass = hass
+    # The handler only passes hass through, so a sentinel stands in for it;
+    # the service call is a local object so no shared sentinel is mutated
+    hass = sentinel.hass
+    call = SimpleNamespace(hass=hass)
 
     # Create the service handler
     service_handler = invalidate_cache_handler_factory()
@@ -30,17 +26,17 @@ async def test_invalidate_cache_service_calls_invalidate_all_caches():
         # Call the service
         result = await service_handler(call)
 
-        # Assert invalidate_all_user_caches was called with hass
-        mock_invalidate.assert_called_once_with(hass)
+        # Assert invalidate_all_user_caches was called with hass, without
+        # blocking the service call on coordinator refreshes
+        mock_invalidate.assert_called_once_with(hass, background_refresh=True)
 
         # Assert success response
         assert result == {
             "success": True,
-            "message": "All caches invalidated and coordinators refreshed",
+            "message": "All caches invalidated and coordinator refreshes started",
         }
 
 
-@pytest.mark.asyncio
 async def test_cache_invalidate_patterns():
     """Test that cache invalidation uses correct patterns to match all cache keys."""
     from custom_components.tasktracker.cache import TaskTrackerCache
@@ -49,34 +45,41 @@ async def test_cache_invalidate_patterns():
     cache = TaskTrackerCache()
 
     # Add cache entries with different patterns
-    await cache.set("recommended_tasks:gabriel:30", {"data": "task1"})
-    await cache.set("recommended_tasks:sara:60", {"data": "task2"})
-    await cache.set("available_tasks:gabriel:None:None", {"data": "task3"})
-    await cache.set("available_tasks:sara:45:7", {"data": "task4"})
-    await cache.set("leftovers:gabriel", {"data": "leftover1"})
-    await cache.set("leftovers:sara", {"data": "leftover2"})
-    await cache.set("recent_completions:gabriel:None:None", {"data": "completion1"})
-    await cache.set("encouragement:gabriel", {"data": "encourage1"})
-    await cache.set("available_users", {"data": "users"})
+    await cache.set_many(
+        {
+            "recommended_tasks:gabriel:30": {"data": "task1"},
+            "recommended_tasks:sara:60": {"data": "task2"},
+            "available_tasks:gabriel:None:None": {"data": "task3"},
+            "available_tasks:sara:45:7": {"data": "task4"},
+            "leftovers:gabriel": {"data": "leftover1"},
+            "leftovers:sara": {"data": "leftover2"},
+            "recent_completions:gabriel:None:None": {"data": "completion1"},
+            "encouragement:gabriel": {"data": "encourage1"},
+            "available_users": {"data": "users"},
+        }
+    )
 
     # Verify all entries exist
     stats = await cache.get_stats()
     assert stats["total_entries"] == 9
 
     # Invalidate using prefix patterns (as our code does)
-    await cache.invalidate(pattern="recommended_tasks:")
-    await cache.invalidate(pattern="available_tasks:")
-    await cache.invalidate(pattern="leftovers:")
-    await cache.invalidate(pattern="recent_completions:")
-    await cache.invalidate(pattern="encouragement:")
-    await cache.invalidate(pattern="available_users")
+    await cache.invalidate_many(
+        [
+            "recommended_tasks:",
+            "available_tasks:",
+            "leftovers:",
+            "recent_completions:",
+            "encouragement:",
+            "available_users",
+        ]
+    )
 
     # Verify all entries are gone
     stats = await cache.get_stats()
     assert stats["total_entries"] == 0, f"Expected 0 entries, but found {stats['total_entries']}"
 
 
-@pytest.mark.asyncio
 async def test_cache_invalidate_user_specific():
     """Test that user-specific cache keys are matched correctly."""
     from custom_components.tasktracker.cache import TaskTrackerCache
@@ -1,16 +1,20 @@
 """Tests for TaskTracker config flow."""
 
 import asyncio
+import gc
 from collections.abc import Generator
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.const import CONF_API_KEY, CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.tasktracker.api import TaskTrackerAPI
 from custom_components.tasktracker.config_flow import TaskTrackerOptionsFlow
 from custom_components.tasktracker.const import (
     CONF_HA_USER_ID,
@@ -19,6 +23,92 @@ from custom_components.tasktracker.const import (
     DOMAIN,
 )
 
+# Config entry data templates for the options flow tests. mock_config_entry
+# deep-copies config_entry_data, so tests can share these without copying.
+NO_USERS_DATA = {
+    "host": "https://test.example.com",
+    "api_key": "test-key",
+    "users": [],
+}
+ONE_USER_DATA = {
+    **NO_USERS_DATA,
+    "users": [{"ha_user_id": "user1", "tasktracker_username": "testuser1"}],
+}
+TWO_USERS_DATA = {
+    **NO_USERS_DATA,
+    "users": [
+        {"ha_user_id": "user1", "tasktracker_username": "testuser1"},
+        {"ha_user_id": "user2", "tasktracker_username": "testuser2"},
+    ],
+}
+EXISTING_USER_DATA = {
+    **NO_USERS_DATA,
+    "users": [{"ha_user_id": "test-user-id", "tasktracker_username": "existing_user"}],
+}
+
+
+def _find_key(schema: vol.Schema, name: str) -> vol.Marker | None:
+    """Return the Required/Optional marker keying a field of a flow schema."""
+    return next(
+        (key for key in schema.schema if getattr(key, "schema", key) == name), None
+    )
+
+
+@pytest.fixture
+def mock_setup_entry() -> Generator[AsyncMock]:
+    """Mock async_setup_entry."""
+    with patch(
+        "custom_components.tasktracker.async_setup_entry",
+        return_value=True,
+    ) as mock_setup:
+        yield mock_setup
+
+
+@pytest.fixture
+def mock_tasktracker_api() -> Generator[Mock]:
+    """Patch the config flow's API with one whose connection check succeeds."""
+    # Only stub what the flow awaits; spec keeps other attribute access cheap
+    mock_api = Mock(spec=TaskTrackerAPI)
+    mock_api.get_all_tasks = AsyncMock(return_value={"success": True})
+    with patch(
+        "custom_components.tasktracker.config_flow.TaskTrackerAPI",
+        return_value=mock_api,
+    ):
+        yield mock_api
+
+
+@pytest.fixture
+def ha_users(hass: HomeAssistant) -> Generator[list[Mock]]:
+    """Patch the active Home Assistant users offered by the flows."""
+    users = []
+    for user_id, name in (
+        ("test-user-id", "Test User"),
+        ("another-user-id", "Another User"),
+    ):
+        # Mock() reserves the name keyword, so set attributes afterwards
+        user = Mock(id=user_id, is_active=True)
+        user.name = name
+        users.append(user)
+    with patch.object(hass.auth, "async_get_users", return_value=users):
+        yield users
+
+
+@pytest.fixture
+async def at_manage_users(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> ConfigFlowResult:
+    """Open the options flow for mock_config_entry at the manage_users step."""
+    mock_config_entry.add_to_hass(hass)
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    return await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            "host": mock_config_entry.data["host"],
+            "api_key": mock_config_entry.data["api_key"],
+            "action": "manage_users",
+        },
+    )
+
 
 class TestTaskTrackerConfigFlow:
     """Test TaskTracker config flow."""
@@ -30,19 +120,8 @@ class TestTaskTrackerConfigFlow:
         # Force cleanup of any lingering background tasks
         await asyncio.sleep(0.2)
         # Force garbage collection to clean up any remaining objects
-        import gc
         gc.collect()
 
-    @pytest.fixture
-    def mock_setup_entry(self) -> Generator[AsyncMock]:
-        """Mock async_setup_entry."""
-        with patch(
-            "custom_components.tasktracker.async_setup_entry",
-            return_value=True,
-        ) as mock_setup:
-            yield mock_setup
-
-    @pytest.mark.asyncio
     async def test_user_form(self, hass: HomeAssistant) -> None:
         """Test user form is displayed."""
         result = await hass.config_entries.flow.async_init(
@@ -56,124 +135,71 @@ class TestTaskTrackerConfigFlow:
             assert "host" in data_schema.schema
             assert "api_key" in data_schema.schema
 
-    @pytest.mark.asyncio
     async def test_user_form_success(
-        self, hass: HomeAssistant, mock_setup_entry: AsyncMock
+        self,
+        hass: HomeAssistant,
+        mock_setup_entry: AsyncMock,
+        mock_tasktracker_api: Mock,
     ) -> None:
         """Test successful user form submission."""
-        with patch(
-            "custom_components.tasktracker.config_flow.TaskTrackerAPI"
-        ) as mock_api_class:
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.get_all_tasks.return_value = {"success": True}
-
-            result = await hass.config_entries.flow.async_init(
-                DOMAIN, context={"source": config_entries.SOURCE_USER}
-            )
-
-            result = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                {
-                    "host": "https://test.example.com",
-                    "api_key": "test-api-key",
-                },
-            )
-
-            # Check if it's a create entry or form (depends on config flow implementation) # noqa: E501
-            if result.get("type") == FlowResultType.CREATE_ENTRY:
-                assert result.get("title") == "TaskTracker"
-                assert result.get("data", {}).get("host") == "https://test.example.com"
-                assert result.get("data", {}).get("api_key") == "test-api-key"
-            elif result.get("type") == FlowResultType.FORM:
-                # Might go to users setup step
-                assert result.get("step_id") == "users"
-
-    @pytest.mark.asyncio
-    async def test_user_form_invalid_auth(self, hass: HomeAssistant) -> None:
-        """Test user form with invalid authentication."""
-        with patch(
-            "custom_components.tasktracker.config_flow.TaskTrackerAPI"
-        ) as mock_api_class:
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.get_all_tasks.side_effect = Exception("Authentication failed")
-
-            result = await hass.config_entries.flow.async_init(
-                DOMAIN, context={"source": config_entries.SOURCE_USER}
-            )
-
-            result = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                {
-                    "host": "https://test.example.com",
-                    "api_key": "invalid-key",
-                },
-            )
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
 
-            assert result.get("type") == FlowResultType.FORM
-            errors = result.get("errors") or {}
-            assert errors.get("base") in ["auth", "cannot_connect"]
-
-    @pytest.mark.asyncio
-    async def test_user_form_connection_error(self, hass: HomeAssistant) -> None:
-        """Test user form with connection error."""
-        with patch(
-            "custom_components.tasktracker.config_flow.TaskTrackerAPI"
-        ) as mock_api_class:
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.get_all_tasks.side_effect = Exception("Connection failed")
-
-            result = await hass.config_entries.flow.async_init(
-                DOMAIN, context={"source": config_entries.SOURCE_USER}
-            )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                "host": "https://test.example.com",
+                "api_key": "test-api-key",
+            },
+        )
 
-            result = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                {
-                    "host": "https://invalid.example.com",
-                    "api_key": "test-key",
-                },
-            )
+        # Should go to users setup or complete
+        assert result.get("type") in [
+            FlowResultType.FORM,
+            FlowResultType.CREATE_ENTRY,
+        ]
+        if result.get("type") == FlowResultType.CREATE_ENTRY:
+            assert result.get("title") == "TaskTracker"
+            assert result.get("data", {}).get("host") == "https://test.example.com"
+            assert result.get("data", {}).get("api_key") == "test-api-key"
+        elif result.get("type") == FlowResultType.FORM:
+            # Might go to users setup step
+            assert result.get("step_id") == "users"
+
+    @pytest.mark.parametrize(
+        ("exc_msg", "host"),
+        [
+            ("Authentication failed", "https://test.example.com"),
+            ("Connection failed", "https://invalid.example.com"),
+        ],
+    )
+    async def test_user_form_cannot_connect(
+        self,
+        hass: HomeAssistant,
+        mock_tasktracker_api: Mock,
+        exc_msg: str,
+        host: str,
+    ) -> None:
+        """Test user form with invalid authentication or a connection error."""
+        mock_tasktracker_api.get_all_tasks.side_effect = Exception(exc_msg)
 
-            assert result.get("type") == FlowResultType.FORM
-            errors = result.get("errors") or {}
-            assert errors.get("base") in ["auth", "cannot_connect"]
-
-    @pytest.mark.asyncio
-    async def test_user_setup_success(self, hass: HomeAssistant) -> None:
-        """Test users setup step."""
-        with patch(
-            "custom_components.tasktracker.config_flow.TaskTrackerAPI"
-        ) as mock_api_class:
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.get_all_tasks.return_value = {"success": True}
-
-            # Start flow
-            result = await hass.config_entries.flow.async_init(
-                DOMAIN, context={"source": config_entries.SOURCE_USER}
-            )
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
 
-            # Submit user form
-            result = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                {
-                    "host": "https://test.example.com",
-                    "api_key": "test-api-key",
-                },
-            )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                "host": host,
+                "api_key": "test-key",
+            },
+        )
 
-            # Should go to users setup or complete
-            assert result.get("type") in [
-                FlowResultType.FORM,
-                FlowResultType.CREATE_ENTRY,
-            ]
-            if result.get("type") == FlowResultType.FORM:
-                assert result.get("step_id") == "users"
+        assert result.get("type") == FlowResultType.FORM
+        errors = result.get("errors") or {}
+        assert errors.get("base") in ["auth", "cannot_connect"]
 
-    @pytest.mark.asyncio
     async def test_options_flow(
         self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
     ) -> None:
@@ -200,7 +226,6 @@ class TestTaskTrackerConfigFlow:
         # Give any remaining background tasks time to complete
         await asyncio.sleep(0.1)
 
-    @pytest.mark.asyncio
     async def test_options_flow_save_basic(
         self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
     ) -> None:
@@ -228,25 +253,11 @@ class TestTaskTrackerConfigFlow:
         original_users = (mock_config_entry.data or {}).get("users", [])
         assert mock_config_entry.data.get("users") == original_users
 
-    @pytest.mark.asyncio
     async def test_options_flow_manage_users(
-        self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
+        self, at_manage_users: ConfigFlowResult
     ) -> None:
         """Test options flow user management."""
-        mock_config_entry.add_to_hass(hass)
-
-        result = await hass.config_entries.options.async_init(
-            mock_config_entry.entry_id
-        )
-
-        result = await hass.config_entries.options.async_configure(
-            result["flow_id"],
-            {
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "action": "manage_users",
-            },
-        )
+        result = at_manage_users
 
         assert result.get("type") == FlowResultType.FORM
         assert result.get("step_id") == "manage_users"
@@ -256,100 +267,49 @@ class TestTaskTrackerConfigFlow:
         assert data_schema is not None
 
         # Check that the schema contains both current_mappings and action fields
-        schema_fields = [str(field) for field in data_schema.schema]
-        assert any("current_mappings" in field for field in schema_fields)
-        assert any("action" in field for field in schema_fields)
+        assert _find_key(data_schema, "current_mappings") is not None
+        assert _find_key(data_schema, "action") is not None
 
-    @pytest.mark.asyncio
     async def test_options_flow_add_user(
-        self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
+        self,
+        hass: HomeAssistant,
+        at_manage_users: ConfigFlowResult,
+        ha_users: list[Mock],
     ) -> None:
         """Test adding a user mapping through options flow."""
-        # Create a mock user
-        from unittest.mock import Mock
-
-        mock_user = Mock()
-        mock_user.id = "test-user-id"
-        mock_user.name = "Test User"
-        mock_user.is_active = True
-
-        with patch.object(hass.auth, "async_get_users", return_value=[mock_user]):
-            mock_config_entry.add_to_hass(hass)
-
-            result = await hass.config_entries.options.async_init(
-                mock_config_entry.entry_id
-            )
-
-            # Navigate to manage users
-            result = await hass.config_entries.options.async_configure(
-                result["flow_id"],
-                {
-                    "host": "https://test.example.com",
-                    "api_key": "test-key",
-                    "action": "manage_users",
-                },
-            )
-
-            # Navigate to add user
-            result = await hass.config_entries.options.async_configure(
-                result["flow_id"],
-                {"action": "add_user"},
-            )
-
-            assert result.get("type") == FlowResultType.FORM
-            assert result.get("step_id") == "add_user"
-
-            # Add the user mapping
-            result = await hass.config_entries.options.async_configure(
-                result["flow_id"],
-                {
-                    "ha_user_id": "test-user-id",
-                    "tasktracker_username": "testuser",
-                },
-            )
-
-            # Should go back to manage users
-            assert result.get("type") == FlowResultType.FORM
-            assert result.get("step_id") == "manage_users"
-
-    @pytest.mark.asyncio
-    async def test_options_flow_remove_user(self, hass: HomeAssistant) -> None:
-        """Test removing a user mapping through options flow."""
-        # Create config entry with existing user mapping
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "users": [
-                    {
-                        "ha_user_id": "user1",
-                        "tasktracker_username": "testuser1",
-                    },
-                    {
-                        "ha_user_id": "user2",
-                        "tasktracker_username": "testuser2",
-                    },
-                ],
-            },
+        # Navigate to add user
+        result = await hass.config_entries.options.async_configure(
+            at_manage_users["flow_id"],
+            {"action": "add_user"},
         )
-        config_entry.add_to_hass(hass)
 
-        result = await hass.config_entries.options.async_init(config_entry.entry_id)
+        assert result.get("type") == FlowResultType.FORM
+        assert result.get("step_id") == "add_user"
 
-        # Navigate to manage users
+        # Add the user mapping
         result = await hass.config_entries.options.async_configure(
             result["flow_id"],
             {
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "action": "manage_users",
+                "ha_user_id": "test-user-id",
+                "tasktracker_username": "testuser",
             },
         )
 
+        # Should go back to manage users
+        assert result.get("type") == FlowResultType.FORM
+        assert result.get("step_id") == "manage_users"
+
+    @pytest.mark.parametrize("config_entry_data", [TWO_USERS_DATA])
+    async def test_options_flow_remove_user(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        at_manage_users: ConfigFlowResult,
+    ) -> None:
+        """Test removing a user mapping through options flow."""
         # Navigate to remove user (first user)
         result = await hass.config_entries.options.async_configure(
-            result["flow_id"],
+            at_manage_users["flow_id"],
             {"action": "remove_user"},
         )
 
@@ -395,123 +355,59 @@ class TestTaskTrackerConfigFlow:
         assert result.get("type") == FlowResultType.CREATE_ENTRY
 
         # Verify the user mapping was removed from the config entry
-        users = config_entry.data.get("users", [])
+        users = mock_config_entry.data.get("users", [])
         assert len(users) == 0
 
-    @pytest.mark.asyncio
-    async def test_options_flow_save_user_changes(self, hass: HomeAssistant) -> None:
+    @pytest.mark.parametrize("config_entry_data", [ONE_USER_DATA])
+    async def test_options_flow_save_user_changes(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        at_manage_users: ConfigFlowResult,
+    ) -> None:
         """Test saving user mapping changes."""
-        # Create config entry with existing user mapping
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "users": [
-                    {
-                        "ha_user_id": "user1",
-                        "tasktracker_username": "testuser1",
-                    },
-                ],
-            },
-        )
-        config_entry.add_to_hass(hass)
-
-        result = await hass.config_entries.options.async_init(config_entry.entry_id)
-
-        # Navigate to manage users
-        result = await hass.config_entries.options.async_configure(
-            result["flow_id"],
-            {
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "action": "manage_users",
-            },
-        )
-
         # Save changes
         result = await hass.config_entries.options.async_configure(
-            result["flow_id"],
+            at_manage_users["flow_id"],
             {"action": "save"},
         )
 
         assert result.get("type") == FlowResultType.CREATE_ENTRY
         # Should preserve the original config including users in config entry
-        assert config_entry.data.get("host") == "https://test.example.com"
-        assert config_entry.data.get("api_key") == "test-key"
-        assert len(config_entry.data.get("users", [])) == 1
+        assert mock_config_entry.data.get("host") == "https://test.example.com"
+        assert mock_config_entry.data.get("api_key") == "test-key"
+        assert len(mock_config_entry.data.get("users", [])) == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("config_entry_data", [EXISTING_USER_DATA])
     async def test_options_flow_duplicate_user_validation(
-        self, hass: HomeAssistant
+        self,
+        hass: HomeAssistant,
+        at_manage_users: ConfigFlowResult,
+        ha_users: list[Mock],
     ) -> None:
         """Test validation prevents duplicate user mappings."""
-        from unittest.mock import Mock
-
-        mock_user1 = Mock()
-        mock_user1.id = "test-user-id"
-        mock_user1.name = "Test User"
-        mock_user1.is_active = True
-
-        mock_user2 = Mock()
-        mock_user2.id = "another-user-id"
-        mock_user2.name = "Another User"
-        mock_user2.is_active = True
-
-        # Create config entry with existing user mapping
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "users": [
-                    {
-                        "ha_user_id": "test-user-id",
-                        "tasktracker_username": "existing_user",
-                    },
-                ],
-            },
+        # Navigate to add user
+        result = await hass.config_entries.options.async_configure(
+            at_manage_users["flow_id"],
+            {"action": "add_user"},
         )
 
-        with patch.object(
-            hass.auth, "async_get_users", return_value=[mock_user1, mock_user2]
-        ):
-            config_entry.add_to_hass(hass)
-
-            result = await hass.config_entries.options.async_init(config_entry.entry_id)
-
-            # Navigate to manage users -> add user
-            result = await hass.config_entries.options.async_configure(
-                result["flow_id"],
-                {
-                    "host": "https://test.example.com",
-                    "api_key": "test-key",
-                    "action": "manage_users",
-                },
-            )
-
-            result = await hass.config_entries.options.async_configure(
-                result["flow_id"],
-                {"action": "add_user"},
-            )
-
-            # Try to add duplicate TaskTracker username (instead of HA user since that one is filtered out)  # noqa: E501
-            result = await hass.config_entries.options.async_configure(
-                result["flow_id"],
-                {
-                    "ha_user_id": "another-user-id",  # Available user
-                    "tasktracker_username": "existing_user",  # Already mapped
-                },
-            )
+        # Try to add duplicate TaskTracker username (instead of HA user since that one is filtered out)  # noqa: E501
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            {
+                "ha_user_id": "another-user-id",  # Available user
+                "tasktracker_username": "existing_user",  # Already mapped
+            },
+        )
 
-            # Should show error and stay on add_user form
-            assert result.get("type") == FlowResultType.FORM
-            assert result.get("step_id") == "add_user"
-            errors = result.get("errors", {})
-            if errors:
-                assert errors.get("base") == "tasktracker_user_already_mapped"
+        # Should show error and stay on add_user form
+        assert result.get("type") == FlowResultType.FORM
+        assert result.get("step_id") == "add_user"
+        errors = result.get("errors", {})
+        if errors:
+            assert errors.get("base") == "tasktracker_user_already_mapped"
 
-    @pytest.mark.asyncio
     async def test_options_flow_api_key_redaction(
         self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
     ) -> None:
@@ -532,7 +428,6 @@ class TestTaskTrackerConfigFlow:
         if description_placeholders:
             assert "current_users" in description_placeholders
 
-    @pytest.mark.asyncio
     async def test_options_flow_api_key_unchanged_when_redacted(
         self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
     ) -> None:
@@ -559,7 +454,6 @@ class TestTaskTrackerConfigFlow:
         # Host should be updated in config entry
         assert mock_config_entry.data.get("host") == "https://updated.example.com"
 
-    @pytest.mark.asyncio
     async def test_options_flow_api_key_updated_when_changed(
         self, hass: HomeAssistant, mock_config_entry: MockConfigEntry
     ) -> None:
@@ -586,239 +480,116 @@ class TestTaskTrackerConfigFlow:
         # Host should be updated in config entry
         assert mock_config_entry.data.get("host") == "https://updated.example.com"
 
-    @pytest.mark.asyncio
-    async def test_options_flow_manage_users_no_remove_when_empty(
-        self, hass: HomeAssistant
+    @pytest.mark.parametrize(
+        ("config_entry_data", "expect_remove"),
+        [(NO_USERS_DATA, False), (ONE_USER_DATA, True)],
+    )
+    async def test_options_flow_manage_users_remove_option(
+        self, at_manage_users: ConfigFlowResult, expect_remove: bool
     ) -> None:
-        """Test that Remove User Mapping option doesn't appear when no users configured."""  # noqa: E501
-        # Create config entry with no user mappings
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "users": [],  # No users configured
-            },
-        )
-        config_entry.add_to_hass(hass)
-
-        result = await hass.config_entries.options.async_init(config_entry.entry_id)
-
-        # Navigate to manage users
-        result = await hass.config_entries.options.async_configure(
-            result["flow_id"],
-            {
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "action": "manage_users",
-            },
-        )
+        """Test that Remove User Mapping only appears when users are configured."""
+        result = at_manage_users
 
         assert result.get("type") == FlowResultType.FORM
         assert result.get("step_id") == "manage_users"
 
-        # Check that the data schema doesn't include remove_user option
+        # Check whether the data schema includes the remove_user option
         data_schema = result.get("data_schema")
-        if data_schema:
-            # Get the action field choices
-            action_field = None
-            for field in data_schema.schema:
-                if str(field).endswith("'action'"):
-                    action_field = field
-                    break
-
-            if action_field and hasattr(action_field, "container"):
-                available_actions = list(action_field.container.choices.keys())
-                # Should have add_user, save, cancel but not remove_user
-                assert "add_user" in available_actions
-                assert "save" in available_actions
-                assert "cancel" in available_actions
-                assert "remove_user" not in available_actions
-
-    @pytest.mark.asyncio
-    async def test_options_flow_manage_users_has_remove_when_users_exist(
-        self, hass: HomeAssistant
+        assert data_schema is not None
+        available_actions = data_schema.schema[
+            _find_key(data_schema, "action")
+        ].container
+        assert "add_user" in available_actions
+        assert "save" in available_actions
+        assert "cancel" in available_actions
+        assert ("remove_user" in available_actions) is expect_remove
+
+    @pytest.mark.parametrize("config_entry_data", [NO_USERS_DATA])
+    async def test_options_flow_user_mapping_persistence(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        at_manage_users: ConfigFlowResult,
+        ha_users: list[Mock],
     ) -> None:
-        """Test that Remove User Mapping option appears when users are configured."""
-        # Create config entry with user mappings
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "users": [
-                    {
-                        "ha_user_id": "user1",
-                        "tasktracker_username": "testuser1",
-                    },
-                ],
-            },
+        """Test that user mappings are properly persisted when saved."""
+        # Add a user mapping
+        result = await hass.config_entries.options.async_configure(
+            at_manage_users["flow_id"],
+            {"action": "add_user"},
         )
-        config_entry.add_to_hass(hass)
-
-        result = await hass.config_entries.options.async_init(config_entry.entry_id)
 
-        # Navigate to manage users
         result = await hass.config_entries.options.async_configure(
             result["flow_id"],
             {
-                "host": "https://test.example.com",
-                "api_key": "test-key",
-                "action": "manage_users",
+                "ha_user_id": "test-user-id",
+                "tasktracker_username": "testuser",
             },
         )
 
-        assert result.get("type") == FlowResultType.FORM
-        assert result.get("step_id") == "manage_users"
+        # Go back to manage users and save
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            {"action": "save"},
+        )
 
-        # Check that the data schema includes remove_user option
-        data_schema = result.get("data_schema")
-        if data_schema:
-            # Get the action field choices
-            action_field = None
-            for field in data_schema.schema:
-                if str(field).endswith("'action'"):
-                    action_field = field
-                    break
-
-            if action_field and hasattr(action_field, "container"):
-                available_actions = list(action_field.container.choices.keys())
-                # Should have all options including remove_user
-                assert "add_user" in available_actions
-                assert "save" in available_actions
-                assert "cancel" in available_actions
-                assert "remove_user" in available_actions
-
-    @pytest.mark.asyncio
-    async def test_options_flow_user_mapping_persistence(
-        self, hass: HomeAssistant
-    ) -> None:
-        """Test that user mappings are properly persisted when saved."""
-        from unittest.mock import Mock
+        assert result.get("type") == FlowResultType.CREATE_ENTRY
+
+        # Verify the user mapping was saved to the config entry
+        users = mock_config_entry.data.get("users", [])
+        assert len(users) == 1
+        assert users[0]["ha_user_id"] == "test-user-id"
+        assert users[0]["tasktracker_username"] == "testuser"
 
-        mock_user = Mock()
-        mock_user.id = "test-user-id"
-        mock_user.name = "Test User"
-        mock_user.is_active = True
+    async def test_user_step_extracts_user_id_from_selection(
+        self,
+        hass: HomeAssistant,
+        mock_tasktracker_api: Mock,
+        ha_users: list[Mock],
+    ) -> None:
+        """Test that user step properly extracts user ID from dropdown selection."""
+        # Start flow
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
 
-        # Start with no user mappings
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            data={
+        # Submit API form
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
                 "host": "https://test.example.com",
-                "api_key": "test-key",
-                "users": [],
+                "api_key": "test-api-key",
             },
         )
 
-        with patch.object(hass.auth, "async_get_users", return_value=[mock_user]):
-            config_entry.add_to_hass(hass)
-
-            result = await hass.config_entries.options.async_init(config_entry.entry_id)
-
-            # Navigate to manage users
-            result = await hass.config_entries.options.async_configure(
-                result["flow_id"],
-                {
-                    "host": "https://test.example.com",
-                    "api_key": "test-key",
-                    "action": "manage_users",
-                },
-            )
-
-            # Add a user mapping
-            result = await hass.config_entries.options.async_configure(
-                result["flow_id"],
-                {"action": "add_user"},
-            )
-
-            result = await hass.config_entries.options.async_configure(
+        # Should go to users step
+        if (
+            result.get("type") == FlowResultType.FORM
+            and result.get("step_id") == "users"
+        ):
+            # Submit user mapping using dropdown selection
+            result = await hass.config_entries.flow.async_configure(
                 result["flow_id"],
                 {
-                    "ha_user_id": "test-user-id",
-                    "tasktracker_username": "testuser",
+                    "ha_user_selection": "Test User (test-user-id)",
+                    "tasktracker_username": "gabriel",
+                    "add_another_user": False,
                 },
             )
 
-            # Go back to manage users and save
-            result = await hass.config_entries.options.async_configure(
-                result["flow_id"],
-                {"action": "save"},
-            )
-
+            # Should create entry successfully
             assert result.get("type") == FlowResultType.CREATE_ENTRY
+            assert result.get("title") == "TaskTracker"
 
-            # Verify the user mapping was saved to the config entry
-            users = config_entry.data.get("users", [])
+            # Verify user mapping was correctly stored with extracted user ID
+            users = result.get("data", {}).get("users", [])
             assert len(users) == 1
-            assert users[0]["ha_user_id"] == "test-user-id"
-            assert users[0]["tasktracker_username"] == "testuser"
-
-    @pytest.mark.asyncio
-    async def test_user_step_extracts_user_id_from_selection(
-        self, hass: HomeAssistant
-    ) -> None:
-        """Test that user step properly extracts user ID from dropdown selection."""
-        from unittest.mock import Mock
-
-        mock_user = Mock()
-        mock_user.id = "user-id-123"
-        mock_user.name = "Gabriel Hurley"
-        mock_user.is_active = True
-
-        with (
-            patch.object(hass.auth, "async_get_users", return_value=[mock_user]),
-            patch(
-                "custom_components.tasktracker.config_flow.TaskTrackerAPI"
-            ) as mock_api_class,
-        ):
-            mock_api = AsyncMock()
-            mock_api_class.return_value = mock_api
-            mock_api.get_all_tasks.return_value = {"success": True}
+            assert (
+                users[0]["ha_user_id"] == "test-user-id"
+            )  # Should be extracted ID, not display name
+            assert users[0]["tasktracker_username"] == "gabriel"
 
-            # Start flow
-            result = await hass.config_entries.flow.async_init(
-                DOMAIN, context={"source": config_entries.SOURCE_USER}
-            )
-
-            # Submit API form
-            result = await hass.config_entries.flow.async_configure(
-                result["flow_id"],
-                {
-                    "host": "https://test.example.com",
-                    "api_key": "test-api-key",
-                },
-            )
 
-            # Should go to users step
-            if (
-                result.get("type") == FlowResultType.FORM
-                and result.get("step_id") == "users"
-            ):
-                # Submit user mapping using dropdown selection
-                result = await hass.config_entries.flow.async_configure(
-                    result["flow_id"],
-                    {
-                        "ha_user_selection": "Gabriel Hurley (user-id-123)",
-                        "tasktracker_username": "gabriel",
-                        "add_another_user": False,
-                    },
-                )
-
-                # Should create entry successfully
-                assert result.get("type") == FlowResultType.CREATE_ENTRY
-                assert result.get("title") == "TaskTracker"
-
-                # Verify user mapping was correctly stored with extracted user ID
-                users = result.get("data", {}).get("users", [])
-                assert len(users) == 1
-                assert (
-                    users[0]["ha_user_id"] == "user-id-123"
-                )  # Should be extracted ID, not display name
-                assert users[0]["tasktracker_username"] == "gabriel"
-
-
-@pytest.mark.asyncio
 async def test_options_flow_reload_on_api_settings_change(hass: HomeAssistant):
     """Test that changing API settings triggers integration reload."""
     # Create a mock config entry using the proper pattern
@@ -870,7 +641,6 @@ async def test_options_flow_reload_on_api_settings_change(hass: HomeAssistant):
         mock_reload.assert_called_once_with(config_entry.entry_id)
 
 
-@pytest.mark.asyncio
 async def test_options_flow_reload_on_user_mapping_change(hass: HomeAssistant):
     """Test that changing user mappings triggers integration reload."""
     # Create a mock config entry using the proper pattern
@@ -918,7 +688,6 @@ async def test_options_flow_reload_on_user_mapping_change(hass: HomeAssistant):
         mock_reload.assert_called_once_with(config_entry.entry_id)
 
 
-@pytest.mark.asyncio
 async def test_options_flow_preserves_api_key_when_redacted(hass: HomeAssistant):
     """Test that redacted API key placeholder preserves original key."""
     original_api_key = "original_secret_key"
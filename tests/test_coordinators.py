@@ -5,16 +5,28 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from custom_components.tasktracker.api import TaskTrackerAPI
 from custom_components.tasktracker.coordinators import DailyPlanCoordinator
 
 
-@pytest.mark.asyncio
-async def test_daily_plan_coordinator_success(hass):
+@pytest.fixture(scope="module")
+def _api_template() -> AsyncMock:
+    """Create the spec'd API mock once; speccing is the slow part."""
+    return AsyncMock(spec=TaskTrackerAPI)
+
+
+@pytest.fixture
+def api(_api_template: AsyncMock) -> AsyncMock:
+    """Return the shared API mock with calls and canned results cleared."""
+    _api_template.reset_mock(return_value=True, side_effect=True)
+    return _api_template
+
+
+async def test_daily_plan_coordinator_success(hass, api):
     """Test daily plan coordinator successful update."""
-    # Mock API
-    api = AsyncMock(spec=TaskTrackerAPI)
     api.get_daily_plan.return_value = {
         "success": True,
         "data": {
@@ -35,11 +47,9 @@ async def test_daily_plan_coordinator_success(hass):
     assert api.get_daily_plan.call_args.kwargs["username"] == "testuser"
 
 
-@pytest.mark.asyncio
-async def test_daily_plan_coordinator_failure(hass):
+async def test_daily_plan_coordinator_failure(hass, api):
     """Test daily plan coordinator handles API failures gracefully."""
     # Mock API to fail
-    api = AsyncMock(spec=TaskTrackerAPI)
     api.get_daily_plan.return_value = {
         "success": False,
         "error": "Test error",
@@ -56,11 +66,9 @@ async def test_daily_plan_coordinator_failure(hass):
     assert coordinator.last_update_success is False
 
 
-@pytest.mark.asyncio
-async def test_daily_plan_coordinator_exception(hass):
+async def test_daily_plan_coordinator_exception(hass, api):
     """Test daily plan coordinator handles exceptions gracefully."""
     # Mock API to raise exception
-    api = AsyncMock(spec=TaskTrackerAPI)
     api.get_daily_plan.side_effect = Exception("Test exception")
 
     # Create coordinator
@@ -73,20 +81,17 @@ async def test_daily_plan_coordinator_exception(hass):
     assert coordinator.last_update_success is False
 
 
-@pytest.mark.asyncio
-async def test_daily_plan_coordinator_update_interval(hass):
+async def test_daily_plan_coordinator_update_interval(hass, api):
     """Test daily plan coordinator has correct update interval."""
-    api = AsyncMock(spec=TaskTrackerAPI)
     coordinator = DailyPlanCoordinator(hass, api, "testuser")
 
-    # Verify update interval is 180 seconds (3 minutes)
-    assert coordinator.update_interval == timedelta(seconds=180)
+    # Verify update interval is 180 seconds (3 minutes), +/- 15% jitter
+    assert timedelta(seconds=153) <= coordinator.update_interval
+    assert coordinator.update_interval <= timedelta(seconds=207)
 
 
-@pytest.mark.asyncio
-async def test_daily_plan_coordinator_parameters(hass):
+async def test_daily_plan_coordinator_parameters(hass, api):
     """Test coordinator respects select_recommended and fair_weather parameters."""
-    api = AsyncMock(spec=TaskTrackerAPI)
     api.get_daily_plan.return_value = {
         "success": True,
         "data": {"tasks": []},
@@ -106,20 +111,16 @@ async def test_daily_plan_coordinator_parameters(hass):
     assert call_kwargs["fair_weather"] is True
 
 
-@pytest.mark.asyncio
-async def test_coordinator_name(hass):
+async def test_coordinator_name(hass, api):
     """Test coordinator has correct name for logging."""
-    api = AsyncMock(spec=TaskTrackerAPI)
     coordinator = DailyPlanCoordinator(hass, api, "testuser")
 
     assert "Daily Plan" in coordinator.name
     assert "testuser" in coordinator.name
 
 
-@pytest.mark.asyncio
-async def test_coordinator_manual_refresh(hass):
+async def test_coordinator_manual_refresh(hass, api):
     """Test manual coordinator refresh."""
-    api = AsyncMock(spec=TaskTrackerAPI)
     api.get_daily_plan.return_value = {
         "success": True,
         "data": {"tasks": []},
@@ -138,3 +139,27 @@ async def test_coordinator_manual_refresh(hass):
 
     # Verify refresh was requested (call count may vary due to async nature)
     assert api.get_daily_plan.call_count >= 1
+
+
+async def test_coordinator_scheduled_refresh(hass, api):
+    """Test the coordinator refreshes again once its update interval elapses."""
+    api.get_daily_plan.return_value = {
+        "success": True,
+        "data": {"tasks": []},
+    }
+
+    coordinator = DailyPlanCoordinator(hass, api, "testuser")
+    # Refreshes are only scheduled while something is listening
+    remove_listener = coordinator.async_add_listener(lambda: None)
+    await coordinator.async_refresh()
+    assert api.get_daily_plan.call_count == 1
+
+    # Fire the scheduled refresh without waiting the interval out in real time
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + coordinator.update_interval + timedelta(seconds=1)
+    )
+    # Scheduled refreshes run as background tasks
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert api.get_daily_plan.call_count == 2
+
+    remove_listener()
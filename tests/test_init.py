@@ -23,11 +23,16 @@ from custom_components.tasktracker.const import (
 class TestTaskTrackerIntegration:
     """Test TaskTracker integration setup and teardown."""
 
+    @pytest.fixture(scope="module")
+    def _config_entry_template(self) -> MagicMock:
+        """Create the spec'd config entry mock once; speccing is the slow part."""
+        return MagicMock(spec=ConfigEntry)
+
     @pytest.fixture
-    def mock_config_entry(self) -> MagicMock:
-        """Create a mock config entry."""
-        return MagicMock(
-            spec=ConfigEntry,
+    def mock_config_entry(self, _config_entry_template: MagicMock) -> MagicMock:
+        """Return the shared config entry mock, reset for this test."""
+        _config_entry_template.reset_mock(return_value=True, side_effect=True)
+        _config_entry_template.configure_mock(
             data={
                 "host": "https://test.example.com",
                 "api_key": "test-api-key",
@@ -37,14 +42,13 @@ class TestTaskTrackerIntegration:
             },
             entry_id="test_entry",
         )
+        return _config_entry_template
 
-    @pytest.mark.asyncio
     async def test_async_setup(self, hass: HomeAssistant) -> None:
         """Test integration setup returns True."""
         result = await async_setup(hass, {})
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_async_setup_entry_success(
         self, hass: HomeAssistant, mock_config_entry: MagicMock
     ) -> None:
@@ -76,7 +80,6 @@ class TestTaskTrackerIntegration:
             # Verify API and services were set up
             mock_setup_services.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_setup_entry_api_failure(
         self, hass: HomeAssistant, mock_config_entry: MagicMock
     ) -> None:
@@ -95,7 +98,6 @@ class TestTaskTrackerIntegration:
             result = await async_setup_entry(hass, mock_config_entry)
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_async_setup_entry_invalid_config(self, hass: HomeAssistant) -> None:
         """Test config entry setup with invalid configuration."""
         invalid_config_entry = MagicMock(
@@ -109,7 +111,6 @@ class TestTaskTrackerIntegration:
         result = await async_setup_entry(hass, invalid_config_entry)
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_async_setup_entry_service_setup_failure(
         self, hass: HomeAssistant, mock_config_entry: MagicMock
     ) -> None:
@@ -132,7 +133,6 @@ class TestTaskTrackerIntegration:
             result = await async_setup_entry(hass, mock_config_entry)
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_async_unload_entry(
         self, hass: HomeAssistant, mock_config_entry: MagicMock
     ) -> None:
@@ -154,7 +154,6 @@ class TestTaskTrackerIntegration:
             assert mock_config_entry.entry_id not in hass.data.get(DOMAIN, {})
             mock_unload_services.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_async_unload_entry_missing_data(
         self, hass: HomeAssistant, mock_config_entry: MagicMock
     ) -> None:
@@ -202,7 +201,6 @@ class TestTaskTrackerIntegration:
         assert "random_event_name" not in TASKTRACKER_EVENTS
         assert "tasktracker_invalid" not in TASKTRACKER_EVENTS
 
-    @pytest.mark.asyncio
     async def test_websocket_event_forwarding_integration(
         self, hass: HomeAssistant
     ) -> None:
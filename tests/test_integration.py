@@ -2,7 +2,6 @@
 
 from unittest.mock import AsyncMock
 
-import pytest
 from aiohttp import ClientSession
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -11,7 +10,6 @@ from custom_components.tasktracker.api import TaskTrackerAPI
 from custom_components.tasktracker.const import DOMAIN
 
 
-@pytest.mark.asyncio
 async def test_setup_integration(
     hass: HomeAssistant, enable_custom_integrations: bool
 ) -> None:
@@ -68,7 +68,6 @@ async def setup_integration_with_coordinator(hass: HomeAssistant):
     return entry, mock_api
 
 
-@pytest.mark.asyncio
 async def test_logical_day_boundary_detection(
     hass: HomeAssistant, setup_integration_with_coordinator
 ):
@@ -140,7 +139,6 @@ async def test_logical_day_boundary_detection(
     assert coordinator.data["data"]["using_defaults"] is True
 
 
-@pytest.mark.asyncio
 async def test_logical_day_boundary_with_matching_date(
     hass: HomeAssistant, setup_integration_with_coordinator
 ):
@@ -189,7 +187,6 @@ async def test_logical_day_boundary_with_matching_date(
     assert mock_api.get_daily_plan.call_count == initial_call_count
 
 
-@pytest.mark.asyncio
 async def test_logical_day_boundary_with_missing_user_context(
     hass: HomeAssistant, setup_integration_with_coordinator
 ):
@@ -238,7 +235,6 @@ async def test_logical_day_boundary_with_missing_user_context(
     assert result["user_context"]["current_logical_date"] == today.isoformat()
 
 
-@pytest.mark.asyncio
 async def test_user_context_location_in_coordinator_data(
     hass: HomeAssistant, setup_integration_with_coordinator
 ):
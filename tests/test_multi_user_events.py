@@ -2,12 +2,10 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 
 from custom_components.tasktracker.const import DOMAIN, SERVICE_COMPLETE_TASK, SERVICE_COMPLETE_TASK_BY_NAME
 
 
-@pytest.mark.asyncio
 async def test_complete_task_includes_assigned_users_in_event(hass, mock_config_entry):
     """Test that completing a task includes assigned_users in the event payload."""
     mock_config_entry.add_to_hass(hass)
@@ -68,7 +66,6 @@ async def test_complete_task_includes_assigned_users_in_event(hass, mock_config_
         assert event_data["assigned_users"] == ["gabriel", "sara"]
 
 
-@pytest.mark.asyncio
 async def test_complete_task_by_name_includes_assigned_users_in_event(hass, mock_config_entry):
     """Test that completing a task by name includes assigned_users in the event payload."""
     mock_config_entry.add_to_hass(hass)
@@ -128,7 +125,6 @@ async def test_complete_task_by_name_includes_assigned_users_in_event(hass, mock
         assert event_data["assigned_users"] == ["gabriel", "sara"]
 
 
-@pytest.mark.asyncio
 async def test_complete_task_empty_assigned_users_when_task_not_in_coordinator(hass, mock_config_entry):
     """Test that completing a task returns empty assigned_users when task not found in coordinator."""
     mock_config_entry.add_to_hass(hass)
@@ -188,7 +184,6 @@ async def test_complete_task_empty_assigned_users_when_task_not_in_coordinator(h
         assert event_data["assigned_users"] == []
 
 
-@pytest.mark.asyncio
 async def test_complete_task_searches_all_coordinators_for_assigned_users(hass):
     """Test that task completion searches all user coordinators to find assigned_users."""
     # Create config entry with multiple users
@@ -274,7 +269,6 @@ async def test_complete_task_searches_all_coordinators_for_assigned_users(hass):
         assert event_data["assigned_users"] == ["gabriel", "sara"]
 
 
-@pytest.mark.asyncio
 async def test_complete_task_invalidates_all_user_caches(hass):
     """Test that completing a task invalidates caches for all configured users."""
     # Create config entry with multiple users
@@ -342,7 +336,6 @@ async def test_complete_task_invalidates_all_user_caches(hass):
         # but will be invalidated by the explicit shared cache invalidation logic
 
 
-@pytest.mark.asyncio
 async def test_leftover_disposal_includes_assigned_users_in_event(hass, mock_config_entry):
     """Test that disposing a leftover (via complete_task_by_name with event_type) includes assigned_users."""
     mock_config_entry.add_to_hass(hass)
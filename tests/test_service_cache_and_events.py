@@ -48,7 +48,6 @@ def mock_service_call(mock_hass):
 class TestCompleteTaskHandler:
     """Tests for complete_task service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_event(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated before event is fired."""
         from custom_components.tasktracker.service_handlers.tasks import (
@@ -101,7 +100,6 @@ class TestCompleteTaskHandler:
 class TestCompleteTaskByNameHandler:
     """Tests for complete_task_by_name service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_event(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated before event is fired."""
         from custom_components.tasktracker.service_handlers.tasks import (
@@ -143,7 +141,6 @@ class TestCompleteTaskByNameHandler:
 class TestCreateAdHocTaskHandler:
     """Tests for create_adhoc_task service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_event(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated before event is fired."""
         from custom_components.tasktracker.service_handlers.tasks import (
@@ -184,7 +181,6 @@ class TestCreateAdHocTaskHandler:
 class TestUpdateTaskHandler:
     """Tests for update_task service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_event(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated before event is fired."""
         from custom_components.tasktracker.service_handlers.tasks import (
@@ -224,7 +220,6 @@ class TestUpdateTaskHandler:
 class TestDeleteTaskHandler:
     """Tests for delete_task service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_events(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated before events are fired."""
         from custom_components.tasktracker.service_handlers.tasks import (
@@ -272,7 +267,6 @@ class TestDeleteTaskHandler:
 class TestDeleteCompletionHandler:
     """Tests for delete_completion service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_event(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated before event is fired."""
         from custom_components.tasktracker.service_handlers.completions import (
@@ -310,7 +304,6 @@ class TestDeleteCompletionHandler:
 class TestUpdateCompletionHandler:
     """Tests for update_completion service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_event(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated before event is fired."""
         from custom_components.tasktracker.service_handlers.completions import (
@@ -349,7 +342,6 @@ class TestUpdateCompletionHandler:
 class TestCreateLeftoverHandler:
     """Tests for create_leftover service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_event(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated before event is fired."""
         from custom_components.tasktracker.service_handlers.leftovers import (
@@ -390,7 +382,6 @@ class TestCreateLeftoverHandler:
 class TestSetDailyStateHandler:
     """Tests for set_daily_state service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_correct_event(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated and correct event name is used."""
         from custom_components.tasktracker.service_handlers.daily import (
@@ -434,7 +425,6 @@ class TestSetDailyStateHandler:
 class TestCreateTaskFromDescriptionHandler:
     """Tests for create_task_from_description service handler."""
 
-    @pytest.mark.asyncio
     async def test_invalidates_cache_and_fires_event(self, mock_hass, mock_api, mock_service_call):
         """Test that cache is invalidated before event is fired."""
         from custom_components.tasktracker.service_handlers.tasks import (
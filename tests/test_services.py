@@ -45,7 +45,6 @@ class TestTaskTrackerServices:
         }
         return mock_api
 
-    @pytest.mark.asyncio
     async def test_complete_task_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -89,7 +88,6 @@ class TestTaskTrackerServices:
                 completed_at=None,
             )
 
-    @pytest.mark.asyncio
     async def test_complete_task_service_with_username(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -128,7 +126,6 @@ class TestTaskTrackerServices:
             completed_at=None,
         )
 
-    @pytest.mark.asyncio
     async def test_complete_task_by_name_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -163,7 +160,6 @@ class TestTaskTrackerServices:
                 name="Test Task", completed_by="testuser", notes="Completed by name", completed_at=None
             )
 
-    @pytest.mark.asyncio
     async def test_complete_task_by_name_without_username_uses_user_mapping(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -204,7 +200,6 @@ class TestTaskTrackerServices:
                 completed_at=None,
             )
 
-    @pytest.mark.asyncio
     async def test_complete_task_by_name_service_with_completed_at(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -246,7 +241,6 @@ class TestTaskTrackerServices:
                 completed_at="2024-01-15T14:30:00",
             )
 
-    @pytest.mark.asyncio
     async def test_create_leftover_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -285,7 +279,6 @@ class TestTaskTrackerServices:
                 days_ago=None,
             )
 
-    @pytest.mark.asyncio
     async def test_create_leftover_service_with_all_params(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -323,7 +316,6 @@ class TestTaskTrackerServices:
             days_ago=1,
         )
 
-    @pytest.mark.asyncio
     async def test_create_adhoc_task_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -361,7 +353,6 @@ class TestTaskTrackerServices:
                 priority=3,
             )
 
-    @pytest.mark.asyncio
     async def test_query_task_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -390,7 +381,6 @@ class TestTaskTrackerServices:
             name="Test Task", question_type="safe_to_eat"
         )
 
-    @pytest.mark.asyncio
     async def test_get_recommended_tasks_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -431,7 +421,6 @@ class TestTaskTrackerServices:
                 username="testuser", available_minutes=30
             )
 
-    @pytest.mark.asyncio
     async def test_get_recommended_tasks_service_without_username_uses_user_mapping(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -468,7 +457,6 @@ class TestTaskTrackerServices:
                 username="mapped_user", available_minutes=30
             )
 
-    @pytest.mark.asyncio
     async def test_get_available_tasks_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -498,7 +486,6 @@ class TestTaskTrackerServices:
             username="testuser", available_minutes=45, upcoming_days=7
         )
 
-    @pytest.mark.asyncio
     async def test_get_recent_completions_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -528,7 +515,6 @@ class TestTaskTrackerServices:
             username="testuser", days=7, limit=10
         )
 
-    @pytest.mark.asyncio
     async def test_list_leftovers_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -558,7 +544,6 @@ class TestTaskTrackerServices:
         assert response is not None
         assert response["success"] is True
 
-    @pytest.mark.asyncio
     async def test_get_all_tasks_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -588,7 +573,6 @@ class TestTaskTrackerServices:
         assert response is not None
         assert response["success"] is True
 
-    @pytest.mark.asyncio
     async def test_get_all_tasks_service_no_params(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -619,7 +603,6 @@ class TestTaskTrackerServices:
         assert response is not None
         assert response["success"] is True
 
-    @pytest.mark.asyncio
     async def test_create_task_from_description_uses_user_mapping(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -653,7 +636,6 @@ class TestTaskTrackerServices:
                 assigned_users=["mapped_user"],
             )
 
-    @pytest.mark.asyncio
     async def test_create_task_from_description_with_explicit_user(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -686,7 +668,6 @@ class TestTaskTrackerServices:
             assigned_users=["alice"],
         )
 
-    @pytest.mark.asyncio
     async def test_service_missing_user_context(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -713,7 +694,6 @@ class TestTaskTrackerServices:
                     return_response=True,
                 )
 
-    @pytest.mark.asyncio
     async def test_service_api_error(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -743,7 +723,6 @@ class TestTaskTrackerServices:
                 return_response=True,
             )
 
-    @pytest.mark.asyncio
     async def test_service_api_exception_handling(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -770,7 +749,6 @@ class TestTaskTrackerServices:
                     return_response=True,
                 )
 
-    @pytest.mark.asyncio
     async def test_service_unexpected_exception_handling(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -797,7 +775,6 @@ class TestTaskTrackerServices:
                     return_response=True,
                 )
 
-    @pytest.mark.asyncio
     async def test_get_daily_plan_encouragement_service(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -834,7 +811,6 @@ class TestTaskTrackerServices:
         # Verify API was called
         mock_api.get_daily_plan_encouragement.assert_called_once_with(username="testuser")
 
-    @pytest.mark.asyncio
     async def test_async_unload_services(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
@@ -860,7 +836,6 @@ class TestTaskTrackerServices:
         assert not hass.services.has_service(DOMAIN, SERVICE_COMPLETE_TASK)
         assert not hass.services.has_service(DOMAIN, SERVICE_CREATE_LEFTOVER)
 
-    @pytest.mark.asyncio
     async def test_get_available_users_service_uses_current_config(
         self, hass: HomeAssistant, setup_integration: AsyncMock
     ) -> None:
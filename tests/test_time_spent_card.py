@@ -1,13 +1,11 @@
 """Test TaskTracker Time Spent Card functionality."""
 
 
-import pytest
 
 
 class TestTaskTrackerTimeSpentCard:
     """Test TaskTracker Time Spent Card."""
 
-    @pytest.mark.asyncio
     async def test_time_calculation(self) -> None:
         """Test that time calculation from completions works correctly."""
         # Mock completion data with duration_minutes
@@ -39,7 +37,6 @@ class TestTaskTrackerTimeSpentCard:
 
         assert actual_total == expected_total
 
-    @pytest.mark.asyncio
     async def test_time_calculation_with_missing_durations(self) -> None:
         """Test time calculation handles missing duration_minutes gracefully."""
         # Mock completion data with some missing duration_minutes
@@ -70,7 +67,6 @@ class TestTaskTrackerTimeSpentCard:
 
         assert actual_total == expected_total
 
-    @pytest.mark.asyncio
     async def test_empty_completions(self) -> None:
         """Test time calculation with no completions."""
         mock_completions = []
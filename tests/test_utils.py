@@ -2,12 +2,12 @@
 
 from collections.abc import AsyncGenerator
 
-import pytest
 import pytest_asyncio
 from homeassistant.core import HomeAssistant
 
 from custom_components.tasktracker.const import CONF_USERS, DOMAIN
 from custom_components.tasktracker.utils import (
+    build_user_index,
     format_task_duration,
     format_task_priority,
     format_time_ago,
@@ -40,7 +40,6 @@ class TestTaskTrackerUtils:
         }
         yield hass
 
-    @pytest.mark.asyncio
     async def test_get_user_context_found(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -48,7 +47,6 @@ class TestTaskTrackerUtils:
         result = get_user_context(hass_with_config, "user1")
         assert result == "testuser1"
 
-    @pytest.mark.asyncio
     async def test_get_user_context_not_found(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -56,13 +54,44 @@ class TestTaskTrackerUtils:
         result = get_user_context(hass_with_config, "unknown_user")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_user_context_no_config(self, hass: HomeAssistant) -> None:
         """Test getting user context when no config exists."""
         result = get_user_context(hass, "user1")
         assert result is None
 
-    @pytest.mark.asyncio
+    async def test_user_lookups_use_user_index(self, hass: HomeAssistant) -> None:
+        """Test lookups are served from the index stored with the entry."""
+        config = {
+            CONF_USERS: [
+                {"ha_user_id": "user1", "tasktracker_username": "testuser1"},
+            ]
+        }
+        # The index is authoritative, so a mapping only it knows about proves
+        # the linear scan over config[CONF_USERS] was skipped
+        user_index = build_user_index(
+            [{"ha_user_id": "user9", "tasktracker_username": "indexed"}]
+        )
+        hass.data[DOMAIN] = {"test_entry": {"config": config, "user_index": user_index}}
+
+        assert get_user_context(hass, "user9") == "indexed"
+        assert get_tasktracker_username_for_ha_user(hass, "user9", config) == "indexed"
+        assert get_ha_user_for_tasktracker_username(hass, "indexed", config) == "user9"
+        assert get_tasktracker_username_for_ha_user(hass, "user1", config) is None
+
+    def test_build_user_index_first_mapping_wins(self) -> None:
+        """Test duplicate IDs resolve to the first mapping, like a linear scan."""
+        user_index = build_user_index(
+            [
+                {"ha_user_id": "user1", "tasktracker_username": "first"},
+                {"ha_user_id": "user1", "tasktracker_username": "second"},
+            ]
+        )
+        assert user_index["ha_to_tasktracker"] == {"user1": "first"}
+        assert user_index["tasktracker_to_ha"] == {
+            "first": "user1",
+            "second": "user1",
+        }
+
     async def test_get_tasktracker_username_for_ha_user_found(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -77,7 +106,6 @@ class TestTaskTrackerUtils:
         result = get_tasktracker_username_for_ha_user(hass_with_config, "user1", config)
         assert result == "testuser1"
 
-    @pytest.mark.asyncio
     async def test_get_tasktracker_username_for_ha_user_not_found(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -93,7 +121,6 @@ class TestTaskTrackerUtils:
         )
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_tasktracker_username_for_ha_user_no_users(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -103,7 +130,6 @@ class TestTaskTrackerUtils:
         result = get_tasktracker_username_for_ha_user(hass_with_config, "user1", config)
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_tasktracker_username_for_ha_user_none_user_id(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -133,6 +159,16 @@ class TestTaskTrackerUtils:
         """Test formatting zero duration."""
         assert format_task_duration(0) == "0 min"
 
+    def test_format_task_duration_float(self) -> None:
+        """Test formatting a duration decoded from JSON as a float."""
+        assert format_task_duration(30.0) == "30.0 min"
+        assert format_task_duration(90.0) == "1.0 hr 30.0 min"
+
+    def test_format_time_ago_float(self) -> None:
+        """Test formatting time ago decoded from JSON as a float."""
+        assert format_time_ago(30.0) == "30.0 minutes ago"
+        assert format_time_ago(120.0) == "2.0 hours ago"
+
     def test_format_time_ago_minutes(self) -> None:
         """Test formatting time ago in minutes."""
         assert format_time_ago(30) == "30 minutes ago"
@@ -172,7 +208,6 @@ class TestTaskTrackerUtils:
         result = validate_api_response(None)
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_get_ha_user_for_tasktracker_username_found(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -189,7 +224,6 @@ class TestTaskTrackerUtils:
         )
         assert result == "user1"
 
-    @pytest.mark.asyncio
     async def test_get_ha_user_for_tasktracker_username_not_found(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -205,7 +239,6 @@ class TestTaskTrackerUtils:
         )
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_current_user_context(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -249,7 +282,11 @@ class TestTaskTrackerUtils:
         result = format_task_priority(10)
         assert result == "Priority 10"
 
-    @pytest.mark.asyncio
+    def test_format_task_priority_float(self) -> None:
+        """Test formatting priorities decoded from JSON as floats."""
+        assert format_task_priority(2.0) == "Medium"
+        assert format_task_priority(2.5) == "Priority 2.5"
+
     async def test_get_integration_data_found(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -258,7 +295,6 @@ class TestTaskTrackerUtils:
         assert result is not None
         assert "config" in result
 
-    @pytest.mark.asyncio
     async def test_get_integration_data_not_found(
         self, hass_with_config: HomeAssistant
     ) -> None:
@@ -266,7 +302,6 @@ class TestTaskTrackerUtils:
         result = get_integration_data(hass_with_config, "unknown_entry")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_integration_data_no_domain_data(
         self, hass: HomeAssistant
     ) -> None:
@@ -1,6 +1,7 @@
 """Test frontend resource registration."""
 
-from unittest.mock import Mock, patch
+import os
+from unittest.mock import AsyncMock, Mock, patch
 
 from custom_components.tasktracker.www import JSModuleRegistration
 
@@ -50,6 +51,14 @@ class TestJSModuleRegistration:
         version = registration._get_resource_version(url)
         assert version == "0"
 
+    def test_get_resource_version_ignores_params_ending_in_v(self):
+        """Test version extraction only matches a standalone v parameter."""
+        registration = JSModuleRegistration(Mock())
+
+        url = "/tasktracker/test.js?dev=1"
+        version = registration._get_resource_version(url)
+        assert version == "0"
+
     def test_get_resource_path(self):
         """Test path extraction from URLs."""
         registration = JSModuleRegistration(Mock())
@@ -69,15 +78,13 @@ class TestJSModuleRegistration:
         path = registration._get_resource_path(url)
         assert path == "/tasktracker/test.js"
 
-    @patch("custom_components.tasktracker.www.Path")
-    def test_remove_gzip_files_no_files(self, mock_path):
+    @patch("custom_components.tasktracker.www._WWW_DIR")
+    def test_remove_gzip_files_no_files(self, mock_www_path):
         """Test remove_gzip_files when no gzip files exist."""
         mock_hass = Mock()
         registration = JSModuleRegistration(mock_hass)
 
         # Mock the path operations
-        mock_www_path = Mock()
-        mock_path.return_value.parent = mock_www_path
         mock_www_path.iterdir.return_value = []
 
         # Should not raise any exceptions
@@ -85,6 +92,28 @@ class TestJSModuleRegistration:
 
         mock_www_path.iterdir.assert_called_once()
 
+    def test_remove_gzip_files_removes_stale_gzip(self, tmp_path):
+        """Test only gzip files older than their source file are removed."""
+        registration = JSModuleRegistration(Mock())
+
+        stale_source = tmp_path / "stale.js"
+        stale_gzip = tmp_path / "stale.js.gz"
+        fresh_source = tmp_path / "fresh.js"
+        fresh_gzip = tmp_path / "fresh.js.gz"
+        for file in (stale_source, stale_gzip, fresh_source, fresh_gzip):
+            file.write_text("x")
+        os.utime(stale_gzip, (1000, 1000))
+        os.utime(stale_source, (2000, 2000))
+        os.utime(fresh_source, (1000, 1000))
+        os.utime(fresh_gzip, (2000, 2000))
+
+        with patch("custom_components.tasktracker.www._WWW_DIR", tmp_path):
+            registration.remove_gzip_files()
+
+        assert not stale_gzip.exists()
+        assert fresh_gzip.exists()
+        assert stale_source.exists()
+
     def test_remove_gzip_files_with_files(self):
         """Test remove_gzip_files when gzip files exist."""
         mock_hass = Mock()
@@ -147,6 +176,8 @@ class TestJSModuleRegistration:
         ]
         assert "2" in deleted_ids
         assert "3" in deleted_ids
+        # Resource dicts owned by lovelace must not be annotated
+        assert all("_is_clean" not in resource for resource in duplicate_resources)
 
     async def test_async_register_with_storage_mode(self):
         """Test async_register correctly checks resource_mode for storage mode."""
@@ -251,3 +282,22 @@ class TestJSModuleRegistration:
         # Should return early and NOT process resources in yaml mode
         await registration._async_remove_stale_resources()
         mock_lovelace.resources.async_items.assert_not_called()
+
+    async def test_register_modules_walks_resources_once(self):
+        """Test module registration shares a single pass over lovelace resources."""
+        mock_hass = Mock()
+        mock_lovelace = Mock()
+        mock_lovelace.resource_mode = "storage"
+        mock_lovelace.resources = AsyncMock()
+        mock_lovelace.resources.async_items = Mock(
+            return_value=[{"id": "1", "url": "/tasktracker/removed-card.js?v=1.0.0"}]
+        )
+        mock_hass.data = {"lovelace": mock_lovelace}
+
+        registration = JSModuleRegistration(mock_hass)
+        registration.lovelace = mock_lovelace
+
+        await registration._async_register_modules()
+
+        mock_lovelace.resources.async_items.assert_called_once()
+        mock_lovelace.resources.async_delete_item.assert_called_once_with("1")